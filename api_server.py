@@ -5,25 +5,23 @@ This module provides a REST API and WebSocket server for the capacity
 monitoring web application with Fluent UI 2 frontend.
 """
 
-from fastapi import FastAPI, HTTPException, WebSocket, WebSocketDisconnect, BackgroundTasks
+from fastapi import FastAPI, HTTPException, Query, Request, WebSocket, WebSocketDisconnect, BackgroundTasks
 from fastapi.middleware.cors import CORSMiddleware
 from fastapi.staticfiles import StaticFiles
-from fastapi.responses import FileResponse
+from fastapi.responses import FileResponse, ORJSONResponse, Response, StreamingResponse
 from pydantic import BaseModel
-from typing import List, Optional, Dict, Any
+from typing import List, Literal, Optional, Dict, Any, Set
 import asyncio
-import json
+import hashlib
 import logging
+import time
+import orjson
+from dataclasses import dataclass, field
 from datetime import datetime
 from pathlib import Path
 
 from config import load_config, UnisphereConfig
-from vmax_collector import (
-    VmaxCapacityCollector,
-    ConnectionError as VmaxConnectionError,
-    AuthenticationError,
-    DataCollectionError
-)
+from vmax_collector import VmaxCapacityCollector, SNAPSHOT_CACHE_TTL
 from data_models import CapacitySnapshot
 
 # Configure logging
@@ -33,13 +31,43 @@ logging.basicConfig(
 )
 logger = logging.getLogger(__name__)
 
+
+def dumps_json(content: Any) -> bytes:
+    """Serialize API content (including dataclasses) to JSON bytes."""
+    return orjson.dumps(
+        content,
+        option=orjson.OPT_SERIALIZE_DATACLASS | orjson.OPT_NON_STR_KEYS
+    )
+
+
+class DataclassJSONResponse(ORJSONResponse):
+    """
+    JSON response rendered by orjson.
+
+    orjson serializes dataclass instances natively, so endpoints can return
+    capacity dataclasses directly without converting them to dicts first.
+    Returning an instance from an endpoint also skips FastAPI's
+    jsonable_encoder pass over the content.
+    """
+
+    def render(self, content: Any) -> bytes:
+        return dumps_json(content)
+
+
 # Initialize FastAPI app
 app = FastAPI(
     title="VMAX Capacity Dashboard API",
     description="REST API for Dell PowerMax/VMAX capacity monitoring",
-    version="1.0.0"
+    version="1.0.0",
+    default_response_class=DataclassJSONResponse
 )
 
+# Unisphere configuration file, loaded once at startup
+CONFIG_PATH = "config.json"
+
+# Largest page a list endpoint will build; larger requests get a 422
+MAX_PAGE_SIZE = 10000
+
 # Configure CORS for frontend access
 app.add_middleware(
     CORSMiddleware,
@@ -49,12 +77,33 @@ app.add_middleware(
     allow_headers=["*"],
 )
 
-# Global state
-current_snapshot: Optional[CapacitySnapshot] = None
-collection_in_progress: bool = False
-last_collection_time: Optional[str] = None
-collection_error: Optional[str] = None
-active_websockets: List[WebSocket] = []
+# Application state
+@dataclass
+class AppState:
+    """Server state shared by request handlers and background tasks."""
+    config: Optional[UnisphereConfig] = None
+    snapshot: Optional[CapacitySnapshot] = None
+    last_collection_time: Optional[str] = None
+    # time.monotonic() when snapshot was published
+    published_at: Optional[float] = None
+    error: Optional[str] = None
+    # Response bodies serialized once per snapshot, tagged with etag
+    bodies: Dict[str, bytes] = field(default_factory=dict)
+    top_consumer_bodies: Dict[int, bytes] = field(default_factory=dict)
+    etag: Optional[str] = None
+    # Held for the duration of a collection
+    collection_lock: asyncio.Lock = field(default_factory=asyncio.Lock)
+    # Coarse "now" for response envelopes, refreshed by a background tick
+    now_iso: str = field(default_factory=lambda: datetime.now().isoformat())
+    clock_task: Optional[asyncio.Task] = None
+    
+    @property
+    def in_progress(self) -> bool:
+        """Whether a collection is currently running."""
+        return self.collection_lock.locked()
+
+
+app.state.data = AppState()
 
 # Pydantic models for API responses
 class SystemCapacityResponse(BaseModel):
@@ -109,72 +158,311 @@ class StatusResponse(BaseModel):
 class CollectionRequest(BaseModel):
     force_refresh: bool = False
 
-
-# Helper function to convert dataclass to dict
-def dataclass_to_dict(obj) -> dict:
-    """Convert dataclass to dictionary for JSON serialization."""
-    if hasattr(obj, '__dataclass_fields__'):
-        result = {}
-        for field_name in obj.__dataclass_fields__:
-            value = getattr(obj, field_name)
-            if isinstance(value, list):
-                result[field_name] = [dataclass_to_dict(item) for item in value]
-            elif hasattr(value, '__dataclass_fields__'):
-                result[field_name] = dataclass_to_dict(value)
-            else:
-                result[field_name] = value
-        return result
-    return obj
+class CollectionResponse(BaseModel):
+    # "started": a collection was scheduled; "cached": the snapshot is
+    # younger than SNAPSHOT_CACHE_TTL and force_refresh was not set
+    status: Literal["started", "cached"]
+    message: str
+    timestamp: str
 
 
 # WebSocket connection manager
+# Window over which collection_progress events are coalesced into one frame
+PROGRESS_FLUSH_INTERVAL = 0.05
+
+# Frames buffered per client before it is treated as stalled and dropped
+SEND_QUEUE_SIZE = 100
+
+# Close code sent to a dropped slow client (policy violation), so the
+# frontend's onclose handler reconnects it
+SLOW_CLIENT_CLOSE_CODE = 1008
+SLOW_CLIENT_CLOSE_TIMEOUT = 5.0
+
+
 class ConnectionManager:
+    """
+    Tracks WebSocket clients and fans messages out to them.
+    
+    Each client gets its own send queue drained by a dedicated sender task,
+    so a slow or blocked client never delays delivery to the others.
+    """
+
     def __init__(self):
-        self.active_connections: List[WebSocket] = []
+        self.active_connections: Set[WebSocket] = set()
+        self._queues: Dict[WebSocket, asyncio.Queue] = {}
+        self._senders: Dict[WebSocket, asyncio.Task] = {}
+        self._pending_progress: List[dict] = []
+        self._progress_flush: Optional[asyncio.Task] = None
+        # Referenced until done so the tasks are not garbage collected
+        self._closers: Set[asyncio.Task] = set()
 
     async def connect(self, websocket: WebSocket):
         await websocket.accept()
-        self.active_connections.append(websocket)
+        queue = asyncio.Queue(maxsize=SEND_QUEUE_SIZE)
+        self._queues[websocket] = queue
+        self._senders[websocket] = asyncio.create_task(self._sender(websocket, queue))
+        self.active_connections.add(websocket)
         logger.info(f"WebSocket connected. Total connections: {len(self.active_connections)}")
 
     def disconnect(self, websocket: WebSocket):
-        self.active_connections.remove(websocket)
+        # May be reached from both the endpoint and a failed sender
+        if self._queues.pop(websocket, None) is None:
+            return
+        
+        sender = self._senders.pop(websocket, None)
+        if sender is not None and sender is not asyncio.current_task():
+            sender.cancel()
+        
+        self.active_connections.discard(websocket)
         logger.info(f"WebSocket disconnected. Total connections: {len(self.active_connections)}")
 
-    async def broadcast(self, message: dict):
-        """Broadcast message to all connected clients."""
-        disconnected = []
-        for connection in self.active_connections:
+    async def _sender(self, websocket: WebSocket, queue: asyncio.Queue):
+        """Deliver queued frames to a single client."""
+        while True:
+            payload = await queue.get()
             try:
-                await connection.send_json(message)
+                await websocket.send_text(payload)
             except Exception as e:
-                logger.error(f"Error broadcasting to client: {e}")
-                disconnected.append(connection)
+                logger.error(f"Error sending to client: {e}")
+                self.disconnect(websocket)
+                return
+
+    def send(self, websocket: WebSocket, message: dict):
+        """Queue a message for a single client."""
+        self._enqueue(websocket, dumps_json(message).decode())
+
+    def _enqueue(self, websocket: WebSocket, payload: str):
+        queue = self._queues.get(websocket)
+        if queue is None:
+            return
+        try:
+            queue.put_nowait(payload)
+        except asyncio.QueueFull:
+            logger.warning("Client send queue full; dropping slow client")
+            self.disconnect(websocket)
+            closer = asyncio.create_task(self._close_slow_client(websocket))
+            self._closers.add(closer)
+            closer.add_done_callback(self._closers.discard)
+    
+    async def _close_slow_client(self, websocket: WebSocket):
+        """Close a dropped client's socket so it reconnects instead of going deaf."""
+        try:
+            await asyncio.wait_for(
+                websocket.close(code=SLOW_CLIENT_CLOSE_CODE),
+                SLOW_CLIENT_CLOSE_TIMEOUT
+            )
+        except Exception as e:
+            logger.warning(f"Error closing slow client: {e}")
+
+    async def broadcast(self, message: dict):
+        """Broadcast message to all connected clients."""
+        if message.get("type") == "collection_progress":
+            self._queue_progress(message)
+            return
+        
+        # Deliver any pending progress first so clients see events in order
+        await self._flush_progress()
+        await self._send_all(message)
+
+    def _queue_progress(self, message: dict):
+        """Buffer a progress event; the buffer is flushed after a short window."""
+        self._pending_progress.append(message)
+        if self._progress_flush is None:
+            self._progress_flush = asyncio.create_task(self._flush_progress_later())
+
+    async def _flush_progress_later(self):
+        await asyncio.sleep(PROGRESS_FLUSH_INTERVAL)
+        self._progress_flush = None
+        await self._flush_progress()
+
+    async def _flush_progress(self):
+        """Send buffered progress events as a single message."""
+        if self._progress_flush is not None:
+            self._progress_flush.cancel()
+            self._progress_flush = None
+        
+        events, self._pending_progress = self._pending_progress, []
+        if not events:
+            return
         
-        # Clean up disconnected clients
-        for conn in disconnected:
-            self.disconnect(conn)
+        if len(events) == 1:
+            await self._send_all(events[0])
+        else:
+            await self._send_all({
+                "type": "collection_progress_batch",
+                "events": events
+            })
+
+    async def _send_all(self, message: dict):
+        """Serialize once and queue the frame for every client."""
+        if not self.active_connections:
+            return
+        
+        # Text frames: the frontend parses event.data as a JSON string
+        payload = dumps_json(message).decode()
+        for connection in list(self.active_connections):
+            self._enqueue(connection, payload)
 
 manager = ConnectionManager()
 
 
+# Payload builders for large list endpoints (run in a worker thread)
+def _build_storage_groups_payload(
+    snapshot: CapacitySnapshot,
+    service_level: Optional[str],
+    srp_name: Optional[str],
+    limit: Optional[int]
+) -> bytes:
+    """Filter, limit and serialize storage groups from a snapshot."""
+    # Index buckets are already sorted by capacity (largest first)
+    if service_level and srp_name:
+        storage_groups = [
+            sg for sg in snapshot._by_service_level.get(service_level, [])
+            if sg.srp_name == srp_name
+        ]
+    elif service_level:
+        storage_groups = snapshot._by_service_level.get(service_level, [])
+    elif srp_name:
+        storage_groups = snapshot._by_srp.get(srp_name, [])
+    else:
+        storage_groups = snapshot._sg_sorted
+    
+    # Apply limit
+    if limit:
+        storage_groups = storage_groups[:limit]
+    
+    return dumps_json(storage_groups)
+
+
+def _select_volumes(
+    snapshot: CapacitySnapshot,
+    storage_group: Optional[str],
+    limit: Optional[int],
+    offset: Optional[int]
+):
+    """Return the total match count and the requested page of volumes."""
+    # Index buckets are already sorted by capacity (largest first)
+    if storage_group:
+        volumes = snapshot._vol_by_sg.get(storage_group, [])
+    else:
+        volumes = snapshot._vol_sorted
+    
+    total_count = len(volumes)
+    
+    # Apply pagination
+    volumes = volumes[offset:offset + limit] if limit else volumes[offset:]
+    
+    return total_count, volumes
+
+
+def _build_volumes_payload(
+    snapshot: CapacitySnapshot,
+    storage_group: Optional[str],
+    limit: Optional[int],
+    offset: Optional[int]
+) -> bytes:
+    """Filter, paginate and serialize volumes from a snapshot."""
+    total_count, volumes = _select_volumes(snapshot, storage_group, limit, offset)
+    
+    return dumps_json({
+        "total": total_count,
+        "offset": offset,
+        "limit": limit,
+        "items": volumes
+    })
+
+
+# Per-snapshot response caching
+def _serialize_snapshot_bodies(snapshot: CapacitySnapshot) -> Dict[str, bytes]:
+    """Serialize the snapshot-invariant endpoint bodies once."""
+    return {
+        "system": dumps_json(snapshot.system_capacity),
+        "srps": dumps_json(snapshot.srp_capacities),
+        "summary": dumps_json(snapshot.summary()),
+        "service_levels": dumps_json(snapshot._service_level_breakdown),
+    }
+
+
+# Distinct top-consumers limits whose bodies are cached per snapshot
+MAX_CACHED_TOP_CONSUMER_LIMITS = 16
+DEFAULT_TOP_CONSUMERS = 10
+
+
+def _top_consumers_body(state: AppState, limit: int) -> bytes:
+    """Return the top-consumers body for limit, caching it lazily."""
+    body = state.top_consumer_bodies.get(limit)
+    if body is None:
+        body = dumps_json(state.snapshot._sg_sorted[:limit])
+        if len(state.top_consumer_bodies) < MAX_CACHED_TOP_CONSUMER_LIMITS:
+            state.top_consumer_bodies[limit] = body
+    return body
+
+
+def _snapshot_etag(snapshot: CapacitySnapshot) -> str:
+    """Entity tag identifying a snapshot; changes with every collection."""
+    key = f"{snapshot.array_id}:{snapshot.collection_timestamp}".encode()
+    return f'"{hashlib.blake2b(key, digest_size=8).hexdigest()}"'
+
+
+def _publish_snapshot(state: AppState, snapshot: CapacitySnapshot) -> None:
+    """Make snapshot current, replacing every body cached for the previous one."""
+    state.bodies = _serialize_snapshot_bodies(snapshot)
+    state.top_consumer_bodies = {
+        DEFAULT_TOP_CONSUMERS: dumps_json(snapshot._sg_sorted[:DEFAULT_TOP_CONSUMERS])
+    }
+    state.etag = _snapshot_etag(snapshot)
+    state.snapshot = snapshot
+    state.published_at = time.monotonic()
+
+
+def _cached_response(request: Request, state: AppState, body: bytes) -> Response:
+    """Serve a pre-serialized body, or 304 if the client copy is current."""
+    # no-cache: clients may store the body but must revalidate, so a new
+    # collection is picked up immediately while unchanged data costs a 304
+    headers = {"ETag": state.etag, "Cache-Control": "no-cache"}
+    
+    if_none_match = request.headers.get("if-none-match")
+    if if_none_match:
+        tags = [tag.strip() for tag in if_none_match.split(",")]
+        if state.etag in tags or "*" in tags:
+            return Response(status_code=304, headers=headers)
+    
+    return Response(
+        content=body,
+        media_type="application/json",
+        headers=headers
+    )
+
+
 # Background task for capacity collection
-async def collect_capacity_data():
+async def collect_capacity_data(state: AppState):
     """Background task to collect capacity data from VMAX array."""
-    global current_snapshot, collection_in_progress, last_collection_time, collection_error
+    # Requests racing past the 409 check in trigger_collection each
+    # schedule a task; only the first one to get here collects
+    if state.collection_lock.locked():
+        logger.info("Collection already in progress; skipping duplicate request")
+        return
     
-    collection_in_progress = True
-    collection_error = None
+    async with state.collection_lock:
+        await _run_collection(state)
+
+
+async def _run_collection(state: AppState):
+    """Collect a new snapshot and publish it; called with the lock held."""
+    state.error = None
     
     # Broadcast collection started
     await manager.broadcast({
         "type": "collection_started",
-        "timestamp": datetime.now().isoformat()
+        "timestamp": state.now_iso
     })
     
     try:
         logger.info("Starting capacity collection...")
-        config = load_config("config.json")
+        config = state.config
+        if config is None:
+            # Not available at startup; retry so the error is reported here
+            config = state.config = await asyncio.to_thread(load_config, CONFIG_PATH)
         
         with VmaxCapacityCollector(
             host=config.host,
@@ -182,28 +470,34 @@ async def collect_capacity_data():
             username=config.username,
             password=config.password,
             verify_ssl=config.verify_ssl,
-            array_id=config.array_id
+            array_id=config.array_id,
+            max_workers=config.max_workers
         ) as collector:
             
-            # Collect system data
             await manager.broadcast({
                 "type": "collection_progress",
                 "step": "system",
-                "message": "Collecting system capacity..."
+                "message": "Collecting system, SRP, storage group and volume capacity..."
             })
             
-            snapshot = collector.get_all_capacity_data(config.array_id)
+            # _collect_snapshot fetches the four levels concurrently and
+            # joins every level before returning, so the connection is not
+            # closed under a running level. The server keeps its own
+            # snapshot and stale fallback, so the collector's cache is skipped
+            snapshot = await asyncio.to_thread(
+                collector._collect_snapshot, config.array_id
+            )
             
-            current_snapshot = snapshot
-            last_collection_time = datetime.now().isoformat()
-            collection_error = None
+            _publish_snapshot(state, snapshot)
+            state.last_collection_time = datetime.now().isoformat()
+            state.error = None
             
             logger.info("Capacity collection completed successfully")
             
             # Broadcast collection completed with data
             await manager.broadcast({
                 "type": "collection_completed",
-                "timestamp": last_collection_time,
+                "timestamp": state.last_collection_time,
                 "summary": {
                     "array_id": snapshot.array_id,
                     "total_srps": snapshot.total_srps,
@@ -216,16 +510,58 @@ async def collect_capacity_data():
     except Exception as e:
         error_msg = str(e)
         logger.error(f"Collection failed: {error_msg}")
-        collection_error = error_msg
+        state.error = error_msg
+        if state.snapshot is not None:
+            logger.warning(
+                f"Serving stale snapshot from {state.snapshot.collection_timestamp}"
+            )
         
         await manager.broadcast({
             "type": "collection_error",
             "error": error_msg,
-            "timestamp": datetime.now().isoformat()
+            "timestamp": state.now_iso
         })
-    
-    finally:
-        collection_in_progress = False
+
+
+# Interval at which AppState.now_iso is refreshed
+CLOCK_TICK_INTERVAL = 0.1
+
+
+async def _tick_clock(state: AppState):
+    """Keep the cached envelope timestamp current."""
+    while True:
+        state.now_iso = datetime.now().isoformat()
+        await asyncio.sleep(CLOCK_TICK_INTERVAL)
+
+
+# Application lifecycle
+@app.on_event("startup")
+async def start_clock():
+    """Start refreshing the cached envelope timestamp."""
+    state = app.state.data
+    state.clock_task = asyncio.create_task(_tick_clock(state))
+
+
+@app.on_event("shutdown")
+async def stop_clock():
+    """Stop the envelope timestamp refresh task."""
+    state = app.state.data
+    if state.clock_task is not None:
+        state.clock_task.cancel()
+        state.clock_task = None
+
+
+@app.on_event("startup")
+async def load_app_config():
+    """Load the Unisphere configuration once at startup."""
+    state = app.state.data
+    try:
+        state.config = load_config(CONFIG_PATH)
+        logger.info(f"Configuration loaded from {CONFIG_PATH}")
+    except (FileNotFoundError, ValueError) as e:
+        # Keep the API up; collection retries the load and reports the error
+        logger.warning(f"Configuration not loaded at startup: {e}")
+        state.config = None
 
 
 # API Endpoints
@@ -240,189 +576,234 @@ async def root():
 
 
 @app.get("/api/status", response_model=StatusResponse)
-async def get_status():
+async def get_status(request: Request):
     """Get current collection status."""
+    state = request.app.state.data
     return StatusResponse(
-        collection_in_progress=collection_in_progress,
-        last_collection_time=last_collection_time,
-        has_data=current_snapshot is not None,
-        error=collection_error,
-        array_id=current_snapshot.array_id if current_snapshot else None
+        collection_in_progress=state.in_progress,
+        last_collection_time=state.last_collection_time,
+        has_data=state.snapshot is not None,
+        error=state.error,
+        array_id=state.snapshot.array_id if state.snapshot else None
     )
 
 
-@app.post("/api/collect")
-async def trigger_collection(request: CollectionRequest, background_tasks: BackgroundTasks):
-    """Trigger a new capacity collection."""
-    global collection_in_progress
+@app.post("/api/collect", response_model=CollectionResponse)
+async def trigger_collection(
+    request: Request,
+    body: CollectionRequest,
+    background_tasks: BackgroundTasks
+):
+    """Trigger a collection, unless a recent snapshot can be reused (status "cached")."""
+    state = request.app.state.data
     
-    if collection_in_progress and not request.force_refresh:
+    # force_refresh cannot start a second collection alongside a running one
+    if state.in_progress:
         raise HTTPException(
             status_code=409,
             detail="Collection already in progress"
         )
     
+    # Refreshes faster than the array updates its metrics reuse the snapshot
+    if (
+        not body.force_refresh
+        and state.published_at is not None
+        and time.monotonic() - state.published_at < SNAPSHOT_CACHE_TTL
+    ):
+        return {
+            "status": "cached",
+            "message": "Capacity data collected less than "
+                       f"{SNAPSHOT_CACHE_TTL}s ago; pass force_refresh to re-collect",
+            "timestamp": state.now_iso
+        }
+    
     # Start collection in background
-    background_tasks.add_task(collect_capacity_data)
+    background_tasks.add_task(collect_capacity_data, state)
     
     return {
         "status": "started",
         "message": "Capacity collection initiated",
-        "timestamp": datetime.now().isoformat()
+        "timestamp": state.now_iso
+    }
+
+
+@app.post("/api/reload-config")
+async def reload_config(request: Request):
+    """Reload the Unisphere configuration from disk."""
+    try:
+        config = await asyncio.to_thread(load_config, CONFIG_PATH)
+    except (FileNotFoundError, ValueError) as e:
+        # Keep the previous configuration if the new one is invalid
+        raise HTTPException(status_code=400, detail=str(e))
+    
+    state = request.app.state.data
+    state.config = config
+    logger.info(f"Configuration reloaded from {CONFIG_PATH}")
+    
+    return {
+        "status": "reloaded",
+        "array_id": config.array_id,
+        "timestamp": state.now_iso
     }
 
 
 @app.get("/api/system")
-async def get_system_capacity():
+async def get_system_capacity(request: Request):
     """Get system-level capacity data."""
-    if current_snapshot is None:
+    state = request.app.state.data
+    if state.snapshot is None:
         raise HTTPException(status_code=404, detail="No data available. Run collection first.")
     
-    return dataclass_to_dict(current_snapshot.system_capacity)
+    return _cached_response(request, state, state.bodies["system"])
 
 
 @app.get("/api/srps")
-async def get_srp_capacities():
+async def get_srp_capacities(request: Request):
     """Get all SRP capacity data."""
-    if current_snapshot is None:
+    state = request.app.state.data
+    if state.snapshot is None:
         raise HTTPException(status_code=404, detail="No data available. Run collection first.")
     
-    return [dataclass_to_dict(srp) for srp in current_snapshot.srp_capacities]
+    return _cached_response(request, state, state.bodies["srps"])
 
 
 @app.get("/api/storage-groups")
 async def get_storage_groups(
+    request: Request,
     service_level: Optional[str] = None,
     srp_name: Optional[str] = None,
-    limit: Optional[int] = None
+    limit: Optional[int] = Query(default=None, ge=1, le=MAX_PAGE_SIZE)
 ):
     """Get storage group capacity data with optional filtering."""
-    if current_snapshot is None:
+    snapshot = request.app.state.data.snapshot
+    if snapshot is None:
         raise HTTPException(status_code=404, detail="No data available. Run collection first.")
     
-    storage_groups = current_snapshot.storage_group_capacities
-    
-    # Apply filters
-    if service_level:
-        storage_groups = [sg for sg in storage_groups if sg.service_level == service_level]
-    
-    if srp_name:
-        storage_groups = [sg for sg in storage_groups if sg.srp_name == srp_name]
-    
-    # Sort by capacity (largest first)
-    storage_groups = sorted(storage_groups, key=lambda x: x.capacity_gb, reverse=True)
-    
-    # Apply limit
-    if limit:
-        storage_groups = storage_groups[:limit]
-    
-    return [dataclass_to_dict(sg) for sg in storage_groups]
+    # Filter and serialize off the event loop; large payloads would
+    # otherwise stall WebSocket traffic and other requests
+    payload = await asyncio.to_thread(
+        _build_storage_groups_payload, snapshot, service_level, srp_name, limit
+    )
+    return Response(content=payload, media_type="application/json")
 
 
 @app.get("/api/volumes")
 async def get_volumes(
+    request: Request,
     storage_group: Optional[str] = None,
-    limit: Optional[int] = None,
-    offset: Optional[int] = 0
+    limit: int = Query(default=100, ge=1, le=MAX_PAGE_SIZE),
+    offset: int = Query(default=0, ge=0)
 ):
     """Get volume capacity data with pagination and filtering."""
-    if current_snapshot is None:
+    snapshot = request.app.state.data.snapshot
+    if snapshot is None:
         raise HTTPException(status_code=404, detail="No data available. Run collection first.")
     
-    volumes = current_snapshot.volume_capacities
-    
-    # Apply filter
-    if storage_group:
-        volumes = [v for v in volumes if storage_group in v.storage_groups]
+    payload = await asyncio.to_thread(
+        _build_volumes_payload, snapshot, storage_group, limit, offset
+    )
+    return Response(content=payload, media_type="application/json")
+
+
+# Volumes per NDJSON chunk; bounds memory and yields to the event loop
+STREAM_CHUNK_SIZE = 1000
+
+
+@app.get("/api/volumes/stream")
+async def stream_volumes(
+    request: Request,
+    storage_group: Optional[str] = None,
+    limit: Optional[int] = Query(default=None, ge=1),
+    offset: int = Query(default=0, ge=0)
+):
+    """
+    Stream volume capacity data as NDJSON.
     
-    # Sort by capacity (largest first)
-    volumes = sorted(volumes, key=lambda x: x.capacity_gb, reverse=True)
+    The first line holds the pagination envelope (total, offset, limit);
+    each following line is one volume. Rows are encoded chunk by chunk,
+    so large result sets are never materialized as a single body.
+    """
+    snapshot = request.app.state.data.snapshot
+    if snapshot is None:
+        raise HTTPException(status_code=404, detail="No data available. Run collection first.")
     
-    total_count = len(volumes)
+    total_count, volumes = _select_volumes(snapshot, storage_group, limit, offset)
     
-    # Apply pagination
-    if limit:
-        volumes = volumes[offset:offset + limit]
+    async def generate():
+        yield dumps_json({
+            "total": total_count,
+            "offset": offset,
+            "limit": limit
+        }) + b"\n"
+        
+        for start in range(0, len(volumes), STREAM_CHUNK_SIZE):
+            chunk = volumes[start:start + STREAM_CHUNK_SIZE]
+            yield b"".join(dumps_json(v) + b"\n" for v in chunk)
+            await asyncio.sleep(0)
     
-    return {
-        "total": total_count,
-        "offset": offset,
-        "limit": limit,
-        "items": [dataclass_to_dict(v) for v in volumes]
-    }
+    return StreamingResponse(generate(), media_type="application/x-ndjson")
 
 
 @app.get("/api/summary")
-async def get_summary():
+async def get_summary(request: Request):
     """Get high-level capacity summary."""
-    if current_snapshot is None:
+    state = request.app.state.data
+    if state.snapshot is None:
         raise HTTPException(status_code=404, detail="No data available. Run collection first.")
     
-    return current_snapshot.summary()
+    return _cached_response(request, state, state.bodies["summary"])
 
 
 @app.get("/api/trends/service-levels")
-async def get_service_level_breakdown():
+async def get_service_level_breakdown(request: Request):
     """Get capacity breakdown by service level."""
-    if current_snapshot is None:
+    state = request.app.state.data
+    if state.snapshot is None:
         raise HTTPException(status_code=404, detail="No data available. Run collection first.")
     
-    breakdown = {}
-    for sg in current_snapshot.storage_group_capacities:
-        slo = sg.service_level or "None"
-        if slo not in breakdown:
-            breakdown[slo] = {
-                "service_level": slo,
-                "count": 0,
-                "total_capacity_gb": 0,
-                "num_volumes": 0
-            }
-        breakdown[slo]["count"] += 1
-        breakdown[slo]["total_capacity_gb"] += sg.capacity_gb
-        breakdown[slo]["num_volumes"] += sg.num_volumes
-    
-    return list(breakdown.values())
+    return _cached_response(request, state, state.bodies["service_levels"])
 
 
 @app.get("/api/trends/top-consumers")
-async def get_top_consumers(limit: int = 10):
+async def get_top_consumers(
+    request: Request,
+    limit: int = Query(default=DEFAULT_TOP_CONSUMERS, ge=1, le=MAX_PAGE_SIZE)
+):
     """Get top storage groups by capacity."""
-    if current_snapshot is None:
+    state = request.app.state.data
+    if state.snapshot is None:
         raise HTTPException(status_code=404, detail="No data available. Run collection first.")
     
-    top_sgs = sorted(
-        current_snapshot.storage_group_capacities,
-        key=lambda x: x.capacity_gb,
-        reverse=True
-    )[:limit]
-    
-    return [dataclass_to_dict(sg) for sg in top_sgs]
+    return _cached_response(request, state, _top_consumers_body(state, limit))
 
 
 @app.websocket("/ws")
 async def websocket_endpoint(websocket: WebSocket):
     """WebSocket endpoint for real-time updates."""
     await manager.connect(websocket)
+    state = websocket.app.state.data
     
     try:
         # Send initial status
-        await websocket.send_json({
+        manager.send(websocket, {
             "type": "connected",
             "status": {
-                "collection_in_progress": collection_in_progress,
-                "last_collection_time": last_collection_time,
-                "has_data": current_snapshot is not None
+                "collection_in_progress": state.in_progress,
+                "last_collection_time": state.last_collection_time,
+                "has_data": state.snapshot is not None
             }
         })
         
         # Keep connection alive and handle incoming messages
         while True:
+            # The frontend sends text frames, so receive_bytes() would not
+            # see them; orjson parses the str directly
             data = await websocket.receive_text()
-            message = json.loads(data)
+            message = orjson.loads(data)
             
             # Handle ping/pong for keep-alive
             if message.get("type") == "ping":
-                await websocket.send_json({"type": "pong"})
+                manager.send(websocket, {"type": "pong"})
     
     except WebSocketDisconnect:
         manager.disconnect(websocket)
@@ -432,12 +813,13 @@ async def websocket_endpoint(websocket: WebSocket):
 
 
 @app.get("/api/health")
-async def health_check():
+async def health_check(request: Request):
     """Health check endpoint for monitoring."""
+    state = request.app.state.data
     return {
         "status": "healthy",
-        "timestamp": datetime.now().isoformat(),
-        "has_data": current_snapshot is not None
+        "timestamp": state.now_iso,
+        "has_data": state.snapshot is not None
     }
 
 
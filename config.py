@@ -5,11 +5,11 @@ This module handles loading and validating connection parameters
 for the Unisphere for PowerMax REST API.
 """
 
-import json
 import os
-from typing import Optional
 from dataclasses import dataclass
 
+import orjson
+
 
 @dataclass
 class UnisphereConfig:
@@ -21,6 +21,9 @@ class UnisphereConfig:
     password: str
     array_id: str
     verify_ssl: bool = False
+    # Concurrent REST requests during collection; keep low (2-8) so
+    # Unisphere is not overwhelmed
+    max_workers: int = 4
     
     def validate(self) -> None:
         """Validate required configuration parameters."""
@@ -34,6 +37,8 @@ class UnisphereConfig:
             raise ValueError("Array ID is required")
         if not isinstance(self.port, int) or self.port <= 0:
             raise ValueError("Port must be a positive integer")
+        if not isinstance(self.max_workers, int) or self.max_workers <= 0:
+            raise ValueError("max_workers must be a positive integer")
 
 
 def load_config(config_path: str = "config.json") -> UnisphereConfig:
@@ -49,7 +54,7 @@ def load_config(config_path: str = "config.json") -> UnisphereConfig:
     Raises:
         FileNotFoundError: If config file doesn't exist
         ValueError: If configuration is invalid
-        json.JSONDecodeError: If JSON is malformed
+        orjson.JSONDecodeError: If JSON is malformed (a json.JSONDecodeError subclass)
     """
     if not os.path.exists(config_path):
         raise FileNotFoundError(
@@ -57,8 +62,8 @@ def load_config(config_path: str = "config.json") -> UnisphereConfig:
             f"Please create {config_path} based on config.example.json"
         )
     
-    with open(config_path, 'r') as f:
-        config_data = json.load(f)
+    with open(config_path, 'rb') as f:
+        config_data = orjson.loads(f.read())
     
     config = UnisphereConfig(
         host=config_data.get('unisphere_host', ''),
@@ -66,7 +71,8 @@ def load_config(config_path: str = "config.json") -> UnisphereConfig:
         username=config_data.get('username', ''),
         password=config_data.get('password', ''),
         array_id=config_data.get('array_id', ''),
-        verify_ssl=config_data.get('verify_ssl', False)
+        verify_ssl=config_data.get('verify_ssl', False),
+        max_workers=config_data.get('max_workers', 4)
     )
     
     config.validate()
@@ -84,6 +90,7 @@ def load_config_from_env() -> UnisphereConfig:
     - UNISPHERE_PASSWORD
     - VMAX_ARRAY_ID
     - UNISPHERE_VERIFY_SSL (default: false)
+    - UNISPHERE_MAX_WORKERS (default: 4)
     
     Returns:
         UnisphereConfig object with validated parameters
@@ -97,7 +104,8 @@ def load_config_from_env() -> UnisphereConfig:
         username=os.environ.get('UNISPHERE_USER', ''),
         password=os.environ.get('UNISPHERE_PASSWORD', ''),
         array_id=os.environ.get('VMAX_ARRAY_ID', ''),
-        verify_ssl=os.environ.get('UNISPHERE_VERIFY_SSL', 'false').lower() == 'true'
+        verify_ssl=os.environ.get('UNISPHERE_VERIFY_SSL', 'false').lower() == 'true',
+        max_workers=int(os.environ.get('UNISPHERE_MAX_WORKERS', '4'))
     )
     
     config.validate()
@@ -9,12 +9,26 @@ from Dell PowerMax/VMAX arrays at four distinct levels:
 - Volume
 """
 
+import math
+import sys
+from collections import defaultdict
 from dataclasses import dataclass, field
-from typing import List, Optional
-from datetime import datetime
+from operator import attrgetter
+from typing import Dict, Iterator, List, Optional
 
+import numpy as np
 
-@dataclass
+
+def _to_float(value) -> float:
+    """Coerce an API value to float; missing, malformed or NaN values become 0.0."""
+    try:
+        number = float(value)
+    except (TypeError, ValueError):
+        return 0.0
+    return 0.0 if math.isnan(number) else number
+
+
+@dataclass(slots=True)
 class SystemCapacity:
     """
     System-level (Array-wide) capacity metrics.
@@ -41,7 +55,7 @@ class SystemCapacity:
             )
 
 
-@dataclass
+@dataclass(slots=True)
 class SrpCapacity:
     """
     Storage Resource Pool (SRP) capacity metrics.
@@ -73,7 +87,7 @@ class SrpCapacity:
             )
 
 
-@dataclass
+@dataclass(slots=True)
 class StorageGroupCapacity:
     """
     Storage Group capacity metrics.
@@ -94,9 +108,32 @@ class StorageGroupCapacity:
         """Validate and normalize data."""
         if self.capacity_gb < 0:
             self.capacity_gb = 0.0
+    
+    @classmethod
+    def from_row(cls, row: dict, array_id: str, timestamp: str) -> 'StorageGroupCapacity':
+        """
+        Build from one row of the Enhanced API bulk storage group response.
+        
+        Numeric fields are coerced to 0 when missing or malformed; a row
+        without an id raises. srp and service_level are nested objects
+        ({'id': ...}); names are interned because they repeat across
+        groups and volumes.
+        """
+        service_level = (row.get('service_level') or {}).get('id')
+        srp_name = (row.get('srp') or {}).get('id')
+        return cls(
+            array_id=array_id,
+            storage_group_id=sys.intern(row['id']),
+            timestamp=timestamp,
+            capacity_gb=_to_float(row.get('cap_gb')),
+            num_volumes=int(_to_float(row.get('num_of_volumes'))),
+            service_level=sys.intern(service_level) if service_level else service_level,
+            srp_name=sys.intern(srp_name) if srp_name else srp_name,
+            compression_enabled=bool(row.get('data_reduction_enabled', False))
+        )
 
 
-@dataclass
+@dataclass(slots=True)
 class VolumeCapacity:
     """
     Volume-level capacity metrics.
@@ -120,14 +157,63 @@ class VolumeCapacity:
             self.capacity_gb = 0.0
         if not (0 <= self.allocated_percent <= 100):
             self.allocated_percent = 0.0
+    
+    @classmethod
+    def from_row(cls, row: dict, array_id: str, timestamp: str) -> 'VolumeCapacity':
+        """
+        Build from one row of the Enhanced API bulk volume response.
+        
+        Numeric fields are coerced to 0 when missing or malformed; a row
+        without an id raises. The Enhanced API has no allocated_percent
+        attribute, so it is derived from effective_used_capacity_gb /
+        cap_gb. Storage group names are interned: thousands of volumes
+        share a few of them.
+        """
+        capacity_gb = _to_float(row.get('cap_gb'))
+        used_gb = _to_float(row.get('effective_used_capacity_gb'))
+        return cls(
+            array_id=array_id,
+            volume_id=row['id'],
+            volume_identifier=row.get('identifier', ''),
+            timestamp=timestamp,
+            capacity_gb=capacity_gb,
+            allocated_percent=(used_gb / capacity_gb * 100) if capacity_gb else 0.0,
+            storage_groups=[
+                sys.intern(sg['id'])
+                for sg in row.get('storage_groups') or []
+                if sg.get('id')
+            ],
+            wwn=row.get('wwn'),
+            emulation_type=row.get('type')
+        )
+
 
+def _sorted_by_capacity(items: list) -> list:
+    """
+    Return items ordered by capacity_gb, largest first.
+    
+    The sort runs in C over a float64 column, which holds the exact
+    capacity values; a stable argsort of the negated values matches
+    sorted(items, key=capacity_gb, reverse=True), including tie order.
+    """
+    column = np.fromiter(
+        map(attrgetter('capacity_gb'), items),
+        dtype=np.float64,
+        count=len(items)
+    )
+    order = np.argsort(-column, kind='stable')
+    return [items[i] for i in order.tolist()]
 
-@dataclass
+
+@dataclass(slots=True)
 class CapacitySnapshot:
     """
     Complete capacity snapshot across all four levels.
     
     This is the aggregated result returned by get_all_capacity_data().
+    
+    A snapshot is treated as immutable once collected, so the derived
+    views below are built once at construction and never invalidated.
     """
     array_id: str
     collection_timestamp: str
@@ -136,6 +222,100 @@ class CapacitySnapshot:
     storage_group_capacities: List[StorageGroupCapacity]
     volume_capacities: List[VolumeCapacity]
     
+    # Derived views (largest capacity first)
+    _sg_sorted: List[StorageGroupCapacity] = field(
+        default_factory=list, init=False, repr=False, compare=False
+    )
+    _vol_sorted: List[VolumeCapacity] = field(
+        default_factory=list, init=False, repr=False, compare=False
+    )
+    
+    # Filter indexes over the sorted views, so each bucket is also sorted
+    _by_service_level: Dict[Optional[str], List[StorageGroupCapacity]] = field(
+        default_factory=dict, init=False, repr=False, compare=False
+    )
+    _by_srp: Dict[Optional[str], List[StorageGroupCapacity]] = field(
+        default_factory=dict, init=False, repr=False, compare=False
+    )
+    _vol_by_sg: Dict[str, List[VolumeCapacity]] = field(
+        default_factory=dict, init=False, repr=False, compare=False
+    )
+    
+    # Capacity totals, aggregated once so reports need no extra pass
+    _total_sg_capacity_gb: float = field(
+        default=0.0, init=False, repr=False, compare=False
+    )
+    _total_vol_capacity_gb: float = field(
+        default=0.0, init=False, repr=False, compare=False
+    )
+    
+    # Capacity breakdown by service level, as served by the API
+    _service_level_breakdown: List[dict] = field(
+        default_factory=list, init=False, repr=False, compare=False
+    )
+    
+    def __post_init__(self):
+        """Precompute capacity-sorted views and filter indexes used by the API."""
+        self._total_sg_capacity_gb = math.fsum(
+            map(attrgetter('capacity_gb'), self.storage_group_capacities)
+        )
+        self._total_vol_capacity_gb = math.fsum(
+            map(attrgetter('capacity_gb'), self.volume_capacities)
+        )
+        self._sg_sorted = _sorted_by_capacity(self.storage_group_capacities)
+        self._vol_sorted = _sorted_by_capacity(self.volume_capacities)
+        
+        by_service_level = defaultdict(list)
+        by_srp = defaultdict(list)
+        for sg in self._sg_sorted:
+            by_service_level[sg.service_level].append(sg)
+            by_srp[sg.srp_name].append(sg)
+        
+        vol_by_sg = defaultdict(list)
+        for vol in self._vol_sorted:
+            for sg_name in vol.storage_groups:
+                vol_by_sg[sg_name].append(vol)
+        
+        self._by_service_level = dict(by_service_level)
+        self._by_srp = dict(by_srp)
+        self._vol_by_sg = dict(vol_by_sg)
+        
+        breakdown = {}
+        for sg in self.storage_group_capacities:
+            slo = sg.service_level or "None"
+            entry = breakdown.get(slo)
+            if entry is None:
+                entry = breakdown[slo] = {
+                    "service_level": slo,
+                    "count": 0,
+                    "total_capacity_gb": 0,
+                    "num_volumes": 0
+                }
+            entry["count"] += 1
+            entry["total_capacity_gb"] += sg.capacity_gb
+            entry["num_volumes"] += sg.num_volumes
+        self._service_level_breakdown = list(breakdown.values())
+    
+    @classmethod
+    def from_dict(cls, data: dict) -> 'CapacitySnapshot':
+        """
+        Rebuild a snapshot from its exported JSON form.
+        
+        Accepts the structure written by main.export_to_json().
+        """
+        return cls(
+            array_id=data['array_id'],
+            collection_timestamp=data['collection_timestamp'],
+            system_capacity=SystemCapacity(**data['system_capacity']),
+            srp_capacities=[SrpCapacity(**srp) for srp in data['srp_capacities']],
+            storage_group_capacities=[
+                StorageGroupCapacity(**sg) for sg in data['storage_group_capacities']
+            ],
+            volume_capacities=[
+                VolumeCapacity(**vol) for vol in data['volume_capacities']
+            ]
+        )
+    
     @property
     def total_srps(self) -> int:
         """Return count of SRPs."""
@@ -151,6 +331,20 @@ class CapacitySnapshot:
         """Return count of volumes."""
         return len(self.volume_capacities)
     
+    @property
+    def total_storage_group_capacity_gb(self) -> float:
+        """Return total capacity allocated across storage groups."""
+        return self._total_sg_capacity_gb
+    
+    @property
+    def total_volume_capacity_gb(self) -> float:
+        """Return total capacity across volumes."""
+        return self._total_vol_capacity_gb
+    
+    def iter_volumes(self) -> Iterator[VolumeCapacity]:
+        """Iterate volumes in collection order without building a copy."""
+        return iter(self.volume_capacities)
+    
     def summary(self) -> dict:
         """Return a summary of the capacity snapshot."""
         return {
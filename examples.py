@@ -9,9 +9,20 @@ This script shows:
 5. Export options
 """
 
-from config import load_config
+from config import load_config, UnisphereConfig
 from vmax_collector import VmaxCapacityCollector
-import json
+from collections import defaultdict
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
+import heapq
+
+import orjson
+
+
+@lru_cache(maxsize=4)
+def _cached_config(config_path: str) -> UnisphereConfig:
+    """Load a config file once; chained examples reuse the parsed result."""
+    return load_config(config_path)
 
 
 def example_1_basic_usage():
@@ -19,7 +30,7 @@ def example_1_basic_usage():
     print("=== Example 1: Basic Complete Collection ===\n")
     
     # Load configuration
-    config = load_config("config.json")
+    config = _cached_config("config.json")
     
     # Create collector with context manager (auto-cleanup)
     with VmaxCapacityCollector(
@@ -43,7 +54,7 @@ def example_2_individual_levels():
     """Example 2: Collect individual levels separately."""
     print("\n=== Example 2: Individual Level Collection ===\n")
     
-    config = load_config("config.json")
+    config = _cached_config("config.json")
     
     with VmaxCapacityCollector(
         host=config.host,
@@ -52,18 +63,23 @@ def example_2_individual_levels():
         password=config.password
     ) as collector:
         
-        # Collect only system-level data
-        system = collector.get_system_summary(config.array_id)
+        # The three levels are independent REST calls, so fetch them in parallel
+        with ThreadPoolExecutor(max_workers=3) as executor:
+            f_system = executor.submit(collector.get_system_summary, config.array_id)
+            f_srps = executor.submit(collector.get_srp_capacity, config.array_id)
+            # Storage Groups only (without volumes)
+            f_sgs = executor.submit(collector.get_all_storage_groups, config.array_id)
+            system, srps, storage_groups = f_system.result(), f_srps.result(), f_sgs.result()
+        
+        # System-level data
         print(f"System Used: {system.effective_used_capacity_gb:,.2f} GB")
         
-        # Collect only SRP data
-        srps = collector.get_srp_capacity(config.array_id)
+        # SRP data
         print(f"Number of SRPs: {len(srps)}")
         for srp in srps:
             print(f"  {srp.srp_id}: {srp.utilization_percent:.2f}% utilized")
         
-        # Collect only Storage Groups (without volumes)
-        storage_groups = collector.get_all_storage_groups(config.array_id)
+        # Storage Groups
         print(f"Number of Storage Groups: {len(storage_groups)}")
         
         # Note: Can skip volume collection for faster execution
@@ -74,7 +90,7 @@ def example_3_filtered_collection():
     """Example 3: Filter and analyze specific data."""
     print("\n=== Example 3: Filtered Analysis ===\n")
     
-    config = load_config("config.json")
+    config = _cached_config("config.json")
     
     with VmaxCapacityCollector(
         host=config.host,
@@ -95,7 +111,7 @@ def example_3_filtered_collection():
         print(f"Diamond tier storage groups: {len(diamond_sgs)}")
         
         # Find largest storage groups
-        top_5 = sorted(storage_groups, key=lambda x: x.capacity_gb, reverse=True)[:5]
+        top_5 = heapq.nlargest(5, storage_groups, key=lambda x: x.capacity_gb)
         
         print("\nTop 5 Largest Storage Groups:")
         for i, sg in enumerate(top_5, 1):
@@ -106,7 +122,7 @@ def example_4_custom_export():
     """Example 4: Custom data export formats."""
     print("\n=== Example 4: Custom Export ===\n")
     
-    config = load_config("config.json")
+    config = _cached_config("config.json")
     
     with VmaxCapacityCollector(
         host=config.host,
@@ -117,6 +133,10 @@ def example_4_custom_export():
         
         snapshot = collector.get_all_capacity_data(config.array_id)
         
+        # Capacity totals are pre-aggregated by the snapshot (math.fsum)
+        total_sg_gb = snapshot.total_storage_group_capacity_gb
+        total_vol_gb = snapshot.total_volume_capacity_gb
+        
         # Create custom summary report
         report = {
             'report_metadata': {
@@ -141,31 +161,28 @@ def example_4_custom_export():
             ],
             'storage_groups': {
                 'total_count': snapshot.total_storage_groups,
-                'total_capacity_gb': sum(sg.capacity_gb for sg in snapshot.storage_group_capacities),
+                'total_capacity_gb': total_sg_gb,
                 'by_service_level': {}
             },
             'volumes': {
                 'total_count': snapshot.total_volumes,
-                'total_capacity_gb': sum(v.capacity_gb for v in snapshot.volume_capacities),
-                'average_size_gb': sum(v.capacity_gb for v in snapshot.volume_capacities) / len(snapshot.volume_capacities) if snapshot.volume_capacities else 0
+                'total_capacity_gb': total_vol_gb,
+                'average_size_gb': total_vol_gb / snapshot.total_volumes if snapshot.total_volumes else 0
             }
         }
         
         # Group storage groups by service level
+        by_slo = defaultdict(lambda: {'count': 0, 'total_capacity_gb': 0.0})
         for sg in snapshot.storage_group_capacities:
-            slo = sg.service_level or 'None'
-            if slo not in report['storage_groups']['by_service_level']:
-                report['storage_groups']['by_service_level'][slo] = {
-                    'count': 0,
-                    'total_capacity_gb': 0
-                }
-            report['storage_groups']['by_service_level'][slo]['count'] += 1
-            report['storage_groups']['by_service_level'][slo]['total_capacity_gb'] += sg.capacity_gb
+            entry = by_slo[sg.service_level or 'None']
+            entry['count'] += 1
+            entry['total_capacity_gb'] += sg.capacity_gb
+        report['storage_groups']['by_service_level'] = dict(by_slo)
         
         # Export to JSON
         output_file = f"custom_report_{config.array_id}.json"
-        with open(output_file, 'w') as f:
-            json.dump(report, f, indent=2)
+        with open(output_file, 'wb') as f:
+            f.write(orjson.dumps(report, option=orjson.OPT_INDENT_2))
         
         print(f"Custom report exported to: {output_file}")
 
@@ -177,7 +194,7 @@ def example_5_error_handling():
     from vmax_collector import ConnectionError, AuthenticationError, DataCollectionError
     
     try:
-        config = load_config("config.json")
+        config = _cached_config("config.json")
         
         with VmaxCapacityCollector(
             host=config.host,
@@ -149,7 +149,9 @@ function App() {
 
   const handleRefresh = async () => {
     try {
-      await api.triggerCollection();
+      // An explicit refresh always re-collects; without force_refresh the
+      // server answers "cached" within its snapshot TTL
+      await api.triggerCollection(true);
       loadStatus();
     } catch (error: any) {
       console.error('Failed to trigger collection:', error);
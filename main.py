@@ -6,12 +6,19 @@ It demonstrates usage of the VmaxCapacityCollector and provides
 examples of different output formats.
 """
 
+import os
 import sys
-import json
+import gzip
+import io
+import time
+import argparse
+import heapq
 import logging
-from typing import Optional
+from typing import BinaryIO, List, Optional
 from pathlib import Path
 
+import orjson
+
 from config import load_config, load_config_from_env, UnisphereConfig
 from vmax_collector import (
     VmaxCapacityCollector,
@@ -28,6 +35,13 @@ logging.basicConfig(
 )
 logger = logging.getLogger(__name__)
 
+# Local snapshot cache, so re-runs within the TTL skip collection
+CACHE_DIR = Path(".cache")
+DEFAULT_CACHE_TTL = 300
+
+# Snapshot JSON files run to hundreds of MB on large arrays
+WRITE_BUFFER_SIZE = 1 << 20
+
 
 def print_capacity_summary(snapshot: CapacitySnapshot) -> None:
     """
@@ -51,110 +65,111 @@ def print_capacity_summary(snapshot: CapacitySnapshot) -> None:
     print(f"  Subscribed:       {sys_cap.subscribed_capacity_gb:,.2f} GB")
     
     # SRP summary
+    # Each block is built as one string and written with a single call
     print(f"\n💾 STORAGE RESOURCE POOLS ({snapshot.total_srps})")
-    for srp in snapshot.srp_capacities:
-        print(f"  {srp.srp_id}:")
-        print(f"    Total:          {srp.total_managed_space_gb:,.2f} GB")
-        print(f"    Used:           {srp.used_capacity_gb:,.2f} GB ({srp.utilization_percent:.2f}%)")
-        print(f"    Subscription:   {srp.subscription_percent:.2f}%")
+    srp_blocks = [
+        f"  {srp.srp_id}:\n"
+        f"    Total:          {format(srp.total_managed_space_gb, ',.2f')} GB\n"
+        f"    Used:           {format(srp.used_capacity_gb, ',.2f')} GB ({format(srp.utilization_percent, '.2f')}%)\n"
+        f"    Subscription:   {format(srp.subscription_percent, '.2f')}%\n"
+        for srp in snapshot.srp_capacities
+    ]
+    sys.stdout.write("".join(srp_blocks))
     
     # Storage Group summary
+    # Totals are pre-aggregated by the snapshot
     print(f"\n📦 STORAGE GROUPS ({snapshot.total_storage_groups})")
-    total_sg_capacity = sum(sg.capacity_gb for sg in snapshot.storage_group_capacities)
-    print(f"  Total Allocated:  {total_sg_capacity:,.2f} GB")
+    print(f"  Total Allocated:  {snapshot.total_storage_group_capacity_gb:,.2f} GB")
     
-    # Show top 10 largest storage groups
-    top_sgs = sorted(
+    # Show top 10 largest storage groups (heap keeps only 10 candidates)
+    top_sgs = heapq.nlargest(
+        10,
         snapshot.storage_group_capacities,
-        key=lambda x: x.capacity_gb,
-        reverse=True
-    )[:10]
+        key=lambda x: x.capacity_gb
+    )
     
     if top_sgs:
-        print(f"  Top 10 by Size:")
-        for i, sg in enumerate(top_sgs, 1):
-            print(f"    {i}. {sg.storage_group_id}: {sg.capacity_gb:,.2f} GB ({sg.num_volumes} vols)")
-    
-    # Volume summary
-    print(f"\n💿 VOLUMES ({snapshot.total_volumes})")
-    total_vol_capacity = sum(v.capacity_gb for v in snapshot.volume_capacities)
-    print(f"  Total Capacity:   {total_vol_capacity:,.2f} GB")
+        sg_lines = [
+            f"    {i}. {sg.storage_group_id}: {format(sg.capacity_gb, ',.2f')} GB ({sg.num_volumes} vols)\n"
+            for i, sg in enumerate(top_sgs, 1)
+        ]
+        sys.stdout.write("  Top 10 by Size:\n" + "".join(sg_lines))
     
-    if snapshot.volume_capacities:
-        avg_size = total_vol_capacity / snapshot.total_volumes
-        print(f"  Average Size:     {avg_size:,.2f} GB")
+    # Volume summary (absent when collected with --skip-volumes)
+    n_volumes = snapshot.total_volumes
+    if n_volumes:
+        total_vol_capacity = snapshot.total_volume_capacity_gb
+        print(f"\n💿 VOLUMES ({n_volumes})")
+        print(f"  Total Capacity:   {total_vol_capacity:,.2f} GB")
+        print(f"  Average Size:     {total_vol_capacity / n_volumes:,.2f} GB")
     
     print("\n" + "=" * 80 + "\n")
 
 
-def export_to_json(snapshot: CapacitySnapshot, output_file: str) -> None:
+def write_snapshot_json(snapshot: CapacitySnapshot, f: BinaryIO, pretty: bool = False) -> None:
+    """
+    Write a snapshot as JSON to a binary file object.
+    
+    The SRP, storage group and volume lists are written one item at a
+    time, so no full dict copy of the snapshot is built in memory.
+    
+    Args:
+        snapshot: CapacitySnapshot object to write
+        f: File object opened in binary write mode
+        pretty: Indent each entry for human reading (default: compact)
+    """
+    option = orjson.OPT_INDENT_2 if pretty else 0
+    item_separator = b',\n' if pretty else b','
+    
+    header = {
+        'array_id': snapshot.array_id,
+        'collection_timestamp': snapshot.collection_timestamp,
+        'system_capacity': snapshot.system_capacity
+    }
+    sections = (
+        ('srp_capacities', snapshot.srp_capacities),
+        ('storage_group_capacities', snapshot.storage_group_capacities),
+        ('volume_capacities', snapshot.iter_volumes())
+    )
+    
+    # Header object without its closing brace; lists follow it
+    f.write(orjson.dumps(header, option=option)[:-1])
+    
+    for key, items in sections:
+        f.write(b',' + orjson.dumps(key) + b':[')
+        for i, item in enumerate(items):
+            if i:
+                f.write(item_separator)
+            f.write(orjson.dumps(item, option=option))
+        f.write(b']')
+    
+    f.write(b'}')
+
+
+def export_to_json(snapshot: CapacitySnapshot, output_file: str, pretty: bool = False) -> None:
     """
     Export capacity data to JSON file.
     
+    Paths ending in .gz are gzip-compressed (level 3, fast); other paths
+    are written through a 1 MiB buffer.
+    
     Args:
         snapshot: CapacitySnapshot object to export
         output_file: Path to output JSON file
+        pretty: Indent each entry for human reading (default: compact)
     """
     try:
-        # Convert dataclasses to dictionaries for JSON serialization
-        data = {
-            'array_id': snapshot.array_id,
-            'collection_timestamp': snapshot.collection_timestamp,
-            'system_capacity': {
-                'array_id': snapshot.system_capacity.array_id,
-                'timestamp': snapshot.system_capacity.timestamp,
-                'effective_used_capacity_gb': snapshot.system_capacity.effective_used_capacity_gb,
-                'max_effective_capacity_gb': snapshot.system_capacity.max_effective_capacity_gb,
-                'subscribed_capacity_gb': snapshot.system_capacity.subscribed_capacity_gb,
-                'total_usable_capacity_gb': snapshot.system_capacity.total_usable_capacity_gb,
-                'free_capacity_gb': snapshot.system_capacity.free_capacity_gb,
-                'utilization_percent': snapshot.system_capacity.utilization_percent
-            },
-            'srp_capacities': [
-                {
-                    'array_id': srp.array_id,
-                    'srp_id': srp.srp_id,
-                    'timestamp': srp.timestamp,
-                    'used_capacity_gb': srp.used_capacity_gb,
-                    'subscribed_capacity_gb': srp.subscribed_capacity_gb,
-                    'total_managed_space_gb': srp.total_managed_space_gb,
-                    'free_capacity_gb': srp.free_capacity_gb,
-                    'utilization_percent': srp.utilization_percent,
-                    'subscription_percent': srp.subscription_percent
-                }
-                for srp in snapshot.srp_capacities
-            ],
-            'storage_group_capacities': [
-                {
-                    'array_id': sg.array_id,
-                    'storage_group_id': sg.storage_group_id,
-                    'timestamp': sg.timestamp,
-                    'capacity_gb': sg.capacity_gb,
-                    'num_volumes': sg.num_volumes,
-                    'service_level': sg.service_level,
-                    'srp_name': sg.srp_name,
-                    'compression_enabled': sg.compression_enabled
-                }
-                for sg in snapshot.storage_group_capacities
-            ],
-            'volume_capacities': [
-                {
-                    'array_id': vol.array_id,
-                    'volume_id': vol.volume_id,
-                    'volume_identifier': vol.volume_identifier,
-                    'timestamp': vol.timestamp,
-                    'capacity_gb': vol.capacity_gb,
-                    'allocated_percent': vol.allocated_percent,
-                    'storage_groups': vol.storage_groups,
-                    'wwn': vol.wwn,
-                    'emulation_type': vol.emulation_type
-                }
-                for vol in snapshot.volume_capacities
-            ]
-        }
+        if output_file.endswith('.gz'):
+            # Buffered so per-entry writes reach zlib in large blocks
+            f = io.BufferedWriter(
+                gzip.open(output_file, 'wb', compresslevel=3),
+                buffer_size=WRITE_BUFFER_SIZE
+            )
+        else:
+            f = open(output_file, 'wb', buffering=WRITE_BUFFER_SIZE)
         
-        with open(output_file, 'w') as f:
-            json.dump(data, f, indent=2)
+        with f:
+            write_snapshot_json(snapshot, f, pretty=pretty)
         
         logger.info(f"Capacity data exported to: {output_file}")
         print(f"✅ Data exported to: {output_file}")
@@ -164,16 +179,125 @@ def export_to_json(snapshot: CapacitySnapshot, output_file: str) -> None:
         print(f"❌ Export failed: {e}")
 
 
+def _cache_path(array_id: str, include_volumes: bool = True) -> Path:
+    """Return the snapshot cache file for an array (volume-less runs cached separately)."""
+    suffix = "" if include_volumes else ".no-volumes"
+    return CACHE_DIR / f"{array_id}{suffix}.json"
+
+
+def load_cached_snapshot(
+    array_id: str,
+    ttl: float,
+    include_volumes: bool = True
+) -> Optional[CapacitySnapshot]:
+    """
+    Load a recently collected snapshot from the local cache.
+    
+    Args:
+        array_id: The PowerMax/VMAX array serial number
+        ttl: Maximum cache age in seconds
+        include_volumes: Whether the snapshot must include volume data
+        
+    Returns:
+        Cached CapacitySnapshot, or None if missing, expired or unreadable
+    """
+    cache_path = _cache_path(array_id, include_volumes)
+    
+    try:
+        age = time.time() - cache_path.stat().st_mtime
+    except FileNotFoundError:
+        return None
+    
+    if age >= ttl:
+        logger.info(f"Cached snapshot is {age:.0f}s old (TTL {ttl:.0f}s), re-collecting")
+        return None
+    
+    try:
+        snapshot = CapacitySnapshot.from_dict(orjson.loads(cache_path.read_bytes()))
+    except Exception as e:
+        logger.warning(f"Ignoring unreadable snapshot cache {cache_path}: {e}")
+        return None
+    
+    logger.info(f"Loaded cached snapshot from {cache_path} ({age:.0f}s old)")
+    return snapshot
+
+
+def save_cached_snapshot(snapshot: CapacitySnapshot, include_volumes: bool = True) -> None:
+    """
+    Save a snapshot to the local cache.
+    
+    The file is written to a temporary path and moved into place with
+    os.replace, so readers never see a partially written cache.
+    
+    Args:
+        snapshot: CapacitySnapshot object to cache
+        include_volumes: Whether the snapshot was collected with volume data
+    """
+    cache_path = _cache_path(snapshot.array_id, include_volumes)
+    tmp_path = cache_path.with_suffix('.json.tmp')
+    
+    try:
+        CACHE_DIR.mkdir(parents=True, exist_ok=True)
+        with open(tmp_path, 'wb', buffering=WRITE_BUFFER_SIZE) as f:
+            write_snapshot_json(snapshot, f)
+        os.replace(tmp_path, cache_path)
+        logger.info(f"Snapshot cached to: {cache_path}")
+    except Exception as e:
+        logger.warning(f"Failed to cache snapshot: {e}")
+
+
+def parse_args(argv: Optional[List[str]] = None) -> argparse.Namespace:
+    """
+    Parse command-line arguments.
+    
+    Args:
+        argv: Argument list (default: sys.argv[1:])
+        
+    Returns:
+        Parsed arguments namespace
+    """
+    parser = argparse.ArgumentParser(description="VMAX/PowerMax Capacity Dashboard")
+    parser.add_argument(
+        '--pretty',
+        action='store_true',
+        help="Indent the exported JSON report for human reading"
+    )
+    parser.add_argument(
+        '--gzip',
+        action='store_true',
+        help="Gzip-compress the exported JSON report (.json.gz)"
+    )
+    parser.add_argument(
+        '--skip-volumes',
+        action='store_true',
+        help="Collect system, SRP and storage group data only (much faster)"
+    )
+    parser.add_argument(
+        '--no-cache',
+        action='store_true',
+        help="Always collect from Unisphere, ignoring any cached snapshot"
+    )
+    parser.add_argument(
+        '--ttl',
+        type=float,
+        default=DEFAULT_CACHE_TTL,
+        help=f"Reuse a cached snapshot younger than this many seconds (default: {DEFAULT_CACHE_TTL})"
+    )
+    return parser.parse_args(argv)
+
+
 def main():
     """
     Main application entry point.
     
     Demonstrates three usage patterns:
     1. Load configuration from file
-    2. Connect to Unisphere
-    3. Collect capacity data
+    2. Reuse a cached snapshot if one is recent enough
+    3. Otherwise connect to Unisphere and collect capacity data
     4. Display and export results
     """
+    args = parse_args()
+    
     print("VMAX/PowerMax Capacity Dashboard")
     print("=" * 80)
     
@@ -202,34 +326,52 @@ def main():
         print(f"   Array ID:  {config.array_id}")
         print(f"   User:      {config.username}")
         
-        # Step 2: Initialize collector and connect
-        print(f"\n🔌 Connecting to Unisphere...")
+        # Step 2: Reuse a recent snapshot if one is cached
+        include_volumes = not args.skip_volumes
+        snapshot = None if args.no_cache else load_cached_snapshot(
+            config.array_id, args.ttl, include_volumes
+        )
         
-        # Use context manager to ensure connection is closed
-        with VmaxCapacityCollector(
-            host=config.host,
-            port=config.port,
-            username=config.username,
-            password=config.password,
-            verify_ssl=config.verify_ssl,
-            array_id=config.array_id
-        ) as collector:
-            
-            print(f"✅ Connected successfully\n")
-            
-            # Step 3: Collect capacity data
-            print(f"📊 Collecting capacity data (this may take several minutes)...\n")
-            
-            snapshot = collector.get_all_capacity_data(config.array_id)
-            
-            # Step 4: Display results
-            print_capacity_summary(snapshot)
+        if snapshot is not None:
+            print(f"\n♻️  Using cached snapshot from {snapshot.collection_timestamp}")
+            print("   (run with --no-cache to collect fresh data)")
+        else:
+            # Step 3: Initialize collector and connect
+            print(f"\n🔌 Connecting to Unisphere...")
             
-            # Step 5: Export to JSON (optional)
-            output_file = f"capacity_report_{config.array_id}_{snapshot.collection_timestamp.replace(':', '-')}.json"
-            export_to_json(snapshot, output_file)
+            # Use context manager to ensure connection is closed
+            with VmaxCapacityCollector(
+                host=config.host,
+                port=config.port,
+                username=config.username,
+                password=config.password,
+                verify_ssl=config.verify_ssl,
+                array_id=config.array_id,
+                max_workers=config.max_workers
+            ) as collector:
+                
+                print(f"✅ Connected successfully\n")
+                
+                # Step 4: Collect capacity data
+                print(f"📊 Collecting capacity data (this may take several minutes)...\n")
+                
+                snapshot = collector.get_all_capacity_data(
+                    config.array_id,
+                    include_volumes=include_volumes
+                )
             
-            print("✅ Collection completed successfully!")
+            save_cached_snapshot(snapshot, include_volumes)
+        
+        # Step 5: Display results
+        print_capacity_summary(snapshot)
+        
+        # Step 6: Export to JSON (optional)
+        output_file = f"capacity_report_{config.array_id}_{snapshot.collection_timestamp.replace(':', '-')}.json"
+        if args.gzip:
+            output_file += ".gz"
+        export_to_json(snapshot, output_file, pretty=args.pretty)
+        
+        print("✅ Collection completed successfully!")
     
     except ConnectionError as e:
         logger.error(f"Connection failed: {e}")
@@ -0,0 +1,161 @@
+"""Tests for the API server's collection trigger and WebSocket manager."""
+
+import asyncio
+import time
+import unittest
+from unittest import mock
+
+import orjson
+from fastapi.testclient import TestClient
+
+import api_server
+from api_server import ConnectionManager
+from config import UnisphereConfig
+from data_models import CapacitySnapshot, SystemCapacity, VolumeCapacity
+from vmax_collector import DataCollectionError
+
+from tests.test_vmax_collector import ARRAY_ID, make_collector, make_conn
+
+
+class TriggerCollectionTest(unittest.TestCase):
+
+    def setUp(self):
+        self.state = api_server.AppState()
+        patcher = mock.patch.object(api_server.app.state, 'data', self.state)
+        patcher.start()
+        self.addCleanup(patcher.stop)
+        collect = mock.patch.object(api_server, 'collect_capacity_data', mock.AsyncMock())
+        self.collect = collect.start()
+        self.addCleanup(collect.stop)
+        self.client = TestClient(api_server.app)
+
+    def test_recent_snapshot_is_reused(self):
+        self.state.published_at = time.monotonic()
+
+        response = self.client.post('/api/collect', json={})
+
+        self.assertEqual(response.json()['status'], 'cached')
+        self.collect.assert_not_called()
+
+    def test_force_refresh_collects(self):
+        self.state.published_at = time.monotonic()
+
+        response = self.client.post('/api/collect', json={'force_refresh': True})
+
+        self.assertEqual(response.json()['status'], 'started')
+        self.collect.assert_called_once_with(self.state)
+
+    def test_first_trigger_collects(self):
+        response = self.client.post('/api/collect', json={})
+
+        self.assertEqual(response.json()['status'], 'started')
+        self.collect.assert_called_once()
+
+
+class StreamVolumesTest(unittest.TestCase):
+
+    def setUp(self):
+        state = api_server.AppState()
+        state.snapshot = CapacitySnapshot(
+            array_id='A',
+            collection_timestamp='t',
+            system_capacity=SystemCapacity('A', 't', 0, 0, 0, 0),
+            srp_capacities=[],
+            storage_group_capacities=[],
+            volume_capacities=[
+                VolumeCapacity('A', str(i), '', 't', float(10 - i)) for i in range(5)
+            ]
+        )
+        patcher = mock.patch.object(api_server.app.state, 'data', state)
+        patcher.start()
+        self.addCleanup(patcher.stop)
+        self.client = TestClient(api_server.app)
+
+    def stream(self, **params):
+        response = self.client.get('/api/volumes/stream', params=params)
+        envelope, *rows = map(orjson.loads, response.content.splitlines())
+        return envelope, [row['volume_id'] for row in rows]
+
+    def test_offset_without_limit(self):
+        envelope, volume_ids = self.stream(offset=3)
+
+        self.assertEqual(envelope, {'total': 5, 'offset': 3, 'limit': None})
+        self.assertEqual(volume_ids, ['3', '4'])
+
+    def test_offset_and_limit(self):
+        envelope, volume_ids = self.stream(offset=1, limit=2)
+
+        self.assertEqual(envelope['total'], 5)
+        self.assertEqual(volume_ids, ['1', '2'])
+
+
+class StalledWebSocket:
+    """WebSocket stand-in whose sends never complete."""
+
+    def __init__(self):
+        self.close_code = None
+        self.closed = asyncio.Event()
+
+    async def accept(self):
+        pass
+
+    async def send_text(self, payload):
+        await asyncio.Event().wait()
+
+    async def close(self, code=1000):
+        self.close_code = code
+        self.closed.set()
+
+
+class SlowClientTest(unittest.IsolatedAsyncioTestCase):
+
+    async def test_full_queue_closes_socket(self):
+        manager = ConnectionManager()
+        websocket = StalledWebSocket()
+        await manager.connect(websocket)
+
+        # One frame is held by the stalled sender; the rest fill the queue
+        for i in range(api_server.SEND_QUEUE_SIZE + 2):
+            manager.send(websocket, {"type": "event", "n": i})
+            await asyncio.sleep(0)
+
+        await asyncio.wait_for(websocket.closed.wait(), 1)
+        self.assertEqual(websocket.close_code, api_server.SLOW_CLIENT_CLOSE_CODE)
+        self.assertNotIn(websocket, manager.active_connections)
+
+
+
+class RunCollectionTest(unittest.IsolatedAsyncioTestCase):
+
+    async def test_failed_level_waits_for_the_others(self):
+        collector = make_collector(make_conn())
+        seen_conn = []
+
+        def slow_volumes(array_id, timestamp):
+            time.sleep(0.05)
+            seen_conn.append(collector.conn)
+            return []
+
+        self.enterContext(mock.patch.object(
+            collector, 'get_system_summary', side_effect=DataCollectionError('boom')
+        ))
+        self.enterContext(mock.patch.object(collector, 'get_all_volumes', slow_volumes))
+        self.enterContext(mock.patch.object(collector, 'get_srp_capacity', return_value=[]))
+        self.enterContext(mock.patch.object(collector, 'get_all_storage_groups', return_value=[]))
+        self.enterContext(mock.patch.object(
+            api_server, 'VmaxCapacityCollector', return_value=collector
+        ))
+        state = api_server.AppState(config=UnisphereConfig('h', 8443, 'u', 'p', ARRAY_ID))
+
+        await api_server._run_collection(state)
+
+        self.assertEqual(state.error, 'boom')
+        self.assertIsNone(state.snapshot)
+        # The volume level finished on an open connection, then it was closed
+        self.assertEqual(len(seen_conn), 1)
+        self.assertIsNotNone(seen_conn[0])
+        self.assertIsNone(collector.conn)
+
+
+if __name__ == '__main__':
+    unittest.main()
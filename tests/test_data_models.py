@@ -0,0 +1,56 @@
+"""Tests for the capacity data models."""
+
+import unittest
+from operator import attrgetter
+
+from data_models import (
+    CapacitySnapshot,
+    StorageGroupCapacity,
+    SystemCapacity,
+    VolumeCapacity,
+)
+
+
+def make_snapshot(storage_groups=(), volumes=()):
+    return CapacitySnapshot(
+        array_id='A',
+        collection_timestamp='t',
+        system_capacity=SystemCapacity('A', 't', 0, 0, 0, 0),
+        srp_capacities=[],
+        storage_group_capacities=list(storage_groups),
+        volume_capacities=list(volumes)
+    )
+
+
+class SortedViewTest(unittest.TestCase):
+
+    def test_close_capacities_keep_exact_order(self):
+        # Equal in float32, distinct in float64
+        groups = [
+            StorageGroupCapacity('A', 'x', 't', 200000.01),
+            StorageGroupCapacity('A', 'y', 't', 200000.02),
+        ]
+
+        snapshot = make_snapshot(storage_groups=groups)
+
+        self.assertEqual([sg.storage_group_id for sg in snapshot._sg_sorted], ['y', 'x'])
+
+    def test_matches_sorted_including_ties(self):
+        capacities = [5.0, 1.5, 5.0, 1e6 + 0.01, 1e6 + 0.02, 0.0, 1.5]
+        volumes = [
+            VolumeCapacity('A', str(i), '', 't', capacity)
+            for i, capacity in enumerate(capacities)
+        ]
+
+        snapshot = make_snapshot(volumes=volumes)
+
+        expected = sorted(volumes, key=attrgetter('capacity_gb'), reverse=True)
+        self.assertEqual(snapshot._vol_sorted, expected)
+        self.assertEqual(
+            [v.volume_id for v in snapshot._vol_sorted],
+            [v.volume_id for v in expected]
+        )
+
+
+if __name__ == '__main__':
+    unittest.main()
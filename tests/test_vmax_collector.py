@@ -0,0 +1,178 @@
+"""
+Tests for VmaxCapacityCollector against autospecced PyU4V 10 classes.
+
+The PyU4V mocks are built with create_autospec, so a call whose
+arguments do not match the real PyU4V signature fails as it would
+against Unisphere.
+"""
+
+import unittest
+from unittest import mock
+
+import PyU4V
+from PyU4V.common import CommonFunctions
+from PyU4V.performance import PerformanceFunctions
+from PyU4V.provisioning import ProvisioningFunctions
+from PyU4V.storage_groups import StorageGroupsFunctions
+from PyU4V.volumes import VolumesFunctions
+
+import vmax_collector
+from vmax_collector import VmaxCapacityCollector
+
+ARRAY_ID = '000197900123'
+
+
+def make_conn():
+    """Return an autospecced U4VConn with autospecced function modules."""
+    conn = mock.create_autospec(PyU4V.U4VConn, instance=True)
+    conn.array_id = None
+    conn.set_array_id.side_effect = lambda array_id: setattr(conn, 'array_id', array_id)
+    conn.common = mock.create_autospec(CommonFunctions, instance=True)
+    conn.common.get_array_list.return_value = [ARRAY_ID]
+    conn.performance = mock.create_autospec(PerformanceFunctions, instance=True)
+    conn.provisioning = mock.create_autospec(ProvisioningFunctions, instance=True)
+    conn.storage_groups = mock.create_autospec(StorageGroupsFunctions, instance=True)
+    conn.volumes = mock.create_autospec(VolumesFunctions, instance=True)
+    # Sessions are reconfigured in __init__, not exercised here
+    conn.rest_client = mock.MagicMock()
+    conn.enhanced_rest_client = mock.MagicMock()
+    return conn
+
+
+def make_collector(conn, **kwargs):
+    """Build a collector on conn through the real __init__."""
+    with mock.patch.object(vmax_collector.PyU4V, 'U4VConn', return_value=conn):
+        return VmaxCapacityCollector('unisphere', 'user', 'pass', **kwargs)
+
+
+class PerObjectPathTest(unittest.TestCase):
+    """use_bulk=False sends collection through the provisioning calls."""
+
+    def setUp(self):
+        self.conn = make_conn()
+        self.collector = make_collector(self.conn, use_bulk=False)
+
+    def test_storage_groups(self):
+        provisioning = self.conn.provisioning
+        provisioning.get_storage_group_list.return_value = ['sg1', 'sg2']
+        provisioning.get_storage_group.side_effect = lambda storage_group_name: {
+            'cap_gb': 10.0 if storage_group_name == 'sg1' else 20.0,
+            'num_of_vols': 2,
+            'slo': 'Diamond',
+            'srp': 'SRP_1'
+        }
+
+        groups = self.collector.get_all_storage_groups(ARRAY_ID, 't')
+
+        self.assertEqual([sg.storage_group_id for sg in groups], ['sg1', 'sg2'])
+        self.assertEqual([sg.capacity_gb for sg in groups], [10.0, 20.0])
+        self.assertEqual(self.conn.array_id, ARRAY_ID)
+        provisioning.get_storage_group.assert_any_call(storage_group_name='sg1')
+
+    def test_volumes(self):
+        provisioning = self.conn.provisioning
+        provisioning.get_volume_list.return_value = ['0001A', '0001B']
+        provisioning.get_volume.return_value = {'cap_gb': 5.0}
+
+        volumes = self.collector.get_all_volumes(ARRAY_ID, 't')
+
+        self.assertEqual([v.volume_id for v in volumes], ['0001A', '0001B'])
+        self.assertEqual(self.conn.array_id, ARRAY_ID)
+        provisioning.get_volume_list.assert_called_once_with(filters=None)
+
+    def test_volume_filters(self):
+        provisioning = self.conn.provisioning
+        provisioning.get_volume_list.return_value = []
+
+        self.collector.get_all_volumes(
+            ARRAY_ID, 't',
+            min_cap_gb=10,
+            storage_group_filter='sg1',
+            emulation='FBA'
+        )
+
+        provisioning.get_volume_list.assert_called_once_with(filters={
+            'cap_gb': '>10',
+            'storageGroupId': 'sg1',
+            'emulation': 'FBA'
+        })
+
+    def test_volume_details(self):
+        self.conn.provisioning.get_volume.return_value = {
+            'volume_identifier': 'vol',
+            'cap_gb': 5.0,
+            'allocated_percent': 40.0,
+            'storageGroupId': ['sg1']
+        }
+
+        volume = self.collector._get_volume_details(ARRAY_ID, '0001A', 't')
+
+        self.assertEqual(volume.capacity_gb, 5.0)
+        self.assertEqual(volume.storage_groups, ['sg1'])
+        self.assertEqual(self.conn.array_id, ARRAY_ID)
+        self.conn.provisioning.get_volume.assert_called_once_with(device_id='0001A')
+
+
+class BulkPathTest(unittest.TestCase):
+    """Rows without an id are skipped, not a reason to drop the batch."""
+
+    def setUp(self):
+        self.conn = make_conn()
+        self.collector = make_collector(self.conn)
+
+    def test_storage_group_row_without_id(self):
+        self.conn.storage_groups.get_storage_groups_details.return_value = {
+            'count': 3,
+            'maxPageSize': 1000,
+            'resultList': {'result': [
+                {'id': 'sg1', 'cap_gb': 1.0},
+                {'cap_gb': 2.0},
+                {'id': 'sg3', 'cap_gb': 3.0},
+            ]}
+        }
+
+        groups = self.collector.get_all_storage_groups(ARRAY_ID, 't')
+
+        self.assertEqual([sg.storage_group_id for sg in groups], ['sg1', 'sg3'])
+        self.conn.provisioning.get_storage_group_list.assert_not_called()
+
+    def test_volume_row_without_id(self):
+        self.conn.volumes.get_volumes_details.return_value = {
+            'count': 2,
+            'maxPageSize': 1000,
+            'resultList': {'result': [
+                {'id': '0001A', 'cap_gb': 1.0, 'storage_groups': [{'id': 'sg1'}, {}]},
+                {'identifier': 'orphan', 'cap_gb': 2.0},
+            ]}
+        }
+
+        with mock.patch.object(vmax_collector, 'ijson', None):
+            volumes = self.collector.get_all_volumes(ARRAY_ID, 't')
+
+        self.assertEqual([v.volume_id for v in volumes], ['0001A'])
+        self.assertEqual(volumes[0].storage_groups, ['sg1'])
+        self.conn.provisioning.get_volume_list.assert_not_called()
+
+
+class SrpTest(unittest.TestCase):
+
+    def test_srp_stats(self):
+        conn = make_conn()
+        conn.performance.get_storage_resource_pool_keys.return_value = {
+            'storageResourcePoolInfo': [{'storageResourcePoolId': 'SRP_1'}]
+        }
+        conn.performance.get_storage_resource_pool_stats.return_value = {
+            'result': [{'UsedCapacity': 25, 'SubscribedCapacity': 50, 'TotalManagedSpace': 100}]
+        }
+        collector = make_collector(conn)
+        # Keep the module-level SRP key cache private to this test
+        collector._cache_scope = self.id()
+
+        srps = collector.get_srp_capacity(ARRAY_ID, 't')
+
+        self.assertEqual([srp.srp_id for srp in srps], ['SRP_1'])
+        self.assertEqual(srps[0].utilization_percent, 25.0)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -12,9 +12,17 @@ with at least the "Monitor" role assigned.
 """
 
 import logging
-from typing import List, Dict, Optional
+import math
+import sys
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from typing import Callable, Dict, Iterable, Iterator, List, Optional
 from datetime import datetime
 import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util import make_headers
+from urllib3.util.retry import Retry
 
 try:
     import PyU4V
@@ -23,6 +31,18 @@ except ImportError:
         "PyU4V library is required. Install it with: pip install PyU4V"
     )
 
+try:
+    import ijson
+except ImportError:
+    # Optional: without it bulk volume responses are buffered and parsed at once
+    ijson = None
+
+try:
+    import orjson
+except ImportError:
+    # Optional: without it PyU4V decodes responses with the stdlib json module
+    orjson = None
+
 from data_models import (
     SystemCapacity,
     SrpCapacity,
@@ -38,6 +58,85 @@ logging.basicConfig(
 )
 logger = logging.getLogger(__name__)
 
+# Attributes requested from the Enhanced API bulk endpoints
+STORAGE_GROUP_BULK_ATTRIBUTES = [
+    'id', 'cap_gb', 'num_of_volumes', 'srp.id', 'service_level.id',
+    'data_reduction_enabled'
+]
+VOLUME_BULK_ATTRIBUTES = [
+    'id', 'identifier', 'type', 'wwn', 'storage_groups',
+    'cap_gb', 'effective_used_capacity_gb'
+]
+
+# gzip/deflate, plus br/zstd when urllib3 can decode them
+ACCEPT_ENCODING_HEADER = make_headers(accept_encoding=True)
+
+# Performance keys (array and SRP IDs) rarely change; reuse them this long
+KEY_CACHE_TTL = 60
+# Array capacity is refreshed every few minutes, so dashboards polling
+# faster than this reuse the last snapshot
+SNAPSHOT_CACHE_TTL = 30
+MAX_CACHED_SNAPSHOTS = 4
+
+# TTL caches shared by all collector instances: {key: (expiry, value)}
+_key_cache: Dict[tuple, tuple] = {}
+_key_cache_lock = threading.Lock()
+_snapshot_cache: Dict[tuple, tuple] = {}
+_snapshot_cache_lock = threading.Lock()
+
+
+def _log_content_encoding(response, *args, **kwargs):
+    """requests response hook: debug-log whether Unisphere compressed the body."""
+    if logger.isEnabledFor(logging.DEBUG):
+        logger.debug(
+            f"{response.request.method} {response.url}: Content-Encoding="
+            f"{response.headers.get('Content-Encoding', 'identity')}"
+        )
+    return response
+
+
+def _orjson_response_hook(response, *args, **kwargs):
+    """
+    requests response hook: make response.json() decode with orjson.
+    
+    PyU4V calls response.json() and treats ValueError as "no JSON body";
+    orjson.JSONDecodeError subclasses ValueError, so that still holds.
+    """
+    response.json = lambda **_: orjson.loads(response.content)
+    return response
+
+
+def _rows_with_id(rows: Iterable[Dict], kind: str) -> Iterator[Dict]:
+    """
+    Yield the bulk rows that have an id, logging and skipping the rest.
+    
+    A row without an id cannot be built; skipping it keeps the rest of
+    the bulk result instead of falling back to per-object collection.
+    """
+    for row in rows:
+        if isinstance(row, dict) and row.get('id'):
+            yield row
+        else:
+            logger.warning(f"Skipping {kind} row without an id: {row!r}")
+
+
+class _BoundedHTTPAdapter(HTTPAdapter):
+    """
+    HTTPAdapter that limits how many requests are in flight at once.
+    
+    Each send() holds one slot of a semaphore shared by all sessions of
+    a collector, for as long as urllib3 spends on the request and its
+    retries.
+    """
+    
+    def __init__(self, semaphore: threading.BoundedSemaphore, **kwargs):
+        self._semaphore = semaphore
+        super().__init__(**kwargs)
+    
+    def send(self, request, **kwargs):
+        with self._semaphore:
+            return super().send(request, **kwargs)
+
 
 class VmaxCapacityCollectorError(Exception):
     """Base exception for VmaxCapacityCollector errors."""
@@ -73,6 +172,8 @@ class VmaxCapacityCollector:
     Attributes:
         conn: PyU4V.U4VConn connection object
         array_id: The PowerMax/VMAX array serial number
+        max_workers: Maximum concurrent REST requests during collection
+        use_bulk: Whether Enhanced API bulk queries are tried first
     """
     
     def __init__(
@@ -82,7 +183,12 @@ class VmaxCapacityCollector:
         password: str,
         port: int = 8443,
         verify_ssl: bool = False,
-        array_id: Optional[str] = None
+        array_id: Optional[str] = None,
+        max_workers: int = 4,
+        use_bulk: bool = True,
+        pool_maxsize: int = 50,
+        snapshot_ttl: float = SNAPSHOT_CACHE_TTL,
+        max_concurrent: int = 16
     ):
         """
         Initialize the capacity collector with Unisphere connection.
@@ -94,12 +200,31 @@ class VmaxCapacityCollector:
             port: Unisphere REST API port (default: 8443)
             verify_ssl: Whether to verify SSL certificates (default: False)
             array_id: Optional array ID to set as default
+            max_workers: Maximum concurrent REST requests when fetching
+                volume pages or per-volume details (default: 4)
+            use_bulk: Try the Enhanced API bulk queries for storage groups
+                and volumes before the per-object calls (default: True)
+            pool_maxsize: Keep-alive connections kept open to Unisphere per
+                session; should be at least max_workers (default: 50)
+            snapshot_ttl: Seconds get_all_capacity_data() reuses a snapshot
+                (default: 30)
+            max_concurrent: Maximum REST requests in flight across all
+                levels and workers of this collector (default: 16)
             
         Raises:
             ConnectionError: If unable to connect to Unisphere
             AuthenticationError: If credentials are invalid
         """
+        # Set first so close() works even if connecting fails
+        self.conn: Optional[PyU4V.U4VConn] = None
         self.array_id = array_id
+        self.max_workers = max_workers
+        self.use_bulk = use_bulk
+        self.snapshot_ttl = snapshot_ttl
+        self._cache_scope = f"{host}:{port}"
+        # The four levels run concurrently and each fans out to
+        # max_workers threads; this caps the total sent to Unisphere
+        self._api_semaphore = threading.BoundedSemaphore(max_concurrent)
         
         try:
             logger.info(f"Initializing connection to Unisphere at {host}:{port}")
@@ -114,6 +239,9 @@ class VmaxCapacityCollector:
                 password=password
             )
             
+            # Reuse pooled TLS connections across concurrent requests
+            self._configure_sessions(pool_maxsize)
+            
             # Test the connection by getting array list
             arrays = self.conn.common.get_array_list()
             logger.info(f"Successfully connected. Available arrays: {arrays}")
@@ -147,7 +275,112 @@ class VmaxCapacityCollector:
             logger.error(f"Unexpected error during initialization: {e}")
             raise ConnectionError(f"Initialization failed: {e}") from e
     
-    def get_system_summary(self, array_id: str) -> SystemCapacity:
+    def _configure_sessions(self, pool_maxsize: int) -> None:
+        """
+        Mount a pooled, retrying HTTP adapter on PyU4V's REST sessions.
+        
+        requests keeps only 10 connections per host by default, so bursts of
+        concurrent calls would tear down and re-handshake TLS connections.
+        Every request, retries included, holds a slot of the collector's
+        max_concurrent budget. Throttling (429) and transient gateway
+        errors (502/503/504) are retried with backoff. Compressed responses
+        are requested, since PyU4V replaces the session headers and drops
+        requests' default Accept-Encoding. When orjson is available,
+        PyU4V's response.json() calls decode with it.
+        
+        Args:
+            pool_maxsize: Maximum keep-alive connections per session
+        """
+        retry = Retry(
+            total=3,
+            backoff_factor=0.3,
+            status_forcelist=[429, 502, 503, 504],
+            # Hand the final response to PyU4V's own status handling
+            raise_on_status=False
+        )
+        
+        # Legacy (/univmax/restapi) and Enhanced (/univmax/rest) APIs
+        for rest_client in (self.conn.rest_client, self.conn.enhanced_rest_client):
+            adapter = _BoundedHTTPAdapter(
+                self._api_semaphore,
+                pool_connections=1,
+                pool_maxsize=pool_maxsize,
+                max_retries=retry
+            )
+            rest_client.session.mount('https://', adapter)
+            rest_client.session.mount('http://', adapter)
+            rest_client.session.headers.update(ACCEPT_ENCODING_HEADER)
+            rest_client.session.hooks['response'].append(_log_content_encoding)
+            if orjson is not None:
+                rest_client.session.hooks['response'].append(_orjson_response_hook)
+    
+    def _provisioning(self, array_id: str):
+        """
+        Return conn.provisioning with its array set to array_id.
+        
+        PyU4V 10 provisioning calls take the array from the connection
+        rather than a per-call argument. The levels of one collection
+        share an array, so concurrent callers set the same value.
+        
+        Args:
+            array_id: The PowerMax/VMAX array serial number
+            
+        Returns:
+            PyU4V ProvisioningFunctions for array_id
+        """
+        if self.conn.array_id != array_id:
+            self.conn.set_array_id(array_id)
+        return self.conn.provisioning
+    
+    def _cached_keys(self, kind: str, array_id: Optional[str], fetch: Callable):
+        """
+        Return performance keys from the TTL cache, fetching them on a miss.
+        
+        Empty results are not cached, so a missing key is retried next time.
+        
+        Args:
+            kind: Key type, part of the cache key
+            array_id: Array the keys belong to (None for array-wide lookups)
+            fetch: Zero-argument callable that queries Unisphere
+            
+        Returns:
+            The cached or freshly fetched keys
+        """
+        cache_key = (self._cache_scope, kind, array_id)
+        now = time.monotonic()
+        
+        with _key_cache_lock:
+            entry = _key_cache.get(cache_key)
+        if entry and entry[0] > now:
+            return entry[1]
+        
+        keys = fetch()
+        if keys:
+            with _key_cache_lock:
+                _key_cache[cache_key] = (now + KEY_CACHE_TTL, keys)
+        return keys
+    
+    def _cached_array_keys(self):
+        """Return conn.performance.get_array_keys(), cached for KEY_CACHE_TTL seconds."""
+        return self._cached_keys(
+            'array_keys', None, self.conn.performance.get_array_keys
+        )
+    
+    def _cached_srp_keys(self, array_id: str):
+        """Return the SRP performance keys for an array, cached for KEY_CACHE_TTL seconds."""
+        return self._cached_keys(
+            'srp_keys',
+            array_id,
+            lambda: self.conn.performance.get_storage_resource_pool_keys(
+                array_id=array_id
+            )
+        )
+    
+    def get_system_summary(
+        self,
+        array_id: str,
+        timestamp: Optional[str] = None
+    ) -> SystemCapacity:
         """
         Get system-level (array-wide) capacity summary.
         
@@ -165,6 +398,7 @@ class VmaxCapacityCollector:
         
         Args:
             array_id: The PowerMax/VMAX array serial number
+            timestamp: Timestamp for every returned object (default: now)
             
         Returns:
             SystemCapacity object with array-wide metrics
@@ -175,9 +409,11 @@ class VmaxCapacityCollector:
         try:
             logger.info(f"Collecting system-level capacity for array {array_id}")
             
+            timestamp = timestamp or datetime.now().isoformat()
+            
             # Step 1: Get the array performance key
             # This returns metadata needed to query performance metrics
-            array_keys = self.conn.performance.get_array_keys()
+            array_keys = self._cached_array_keys()
             
             if not array_keys:
                 raise DataCollectionError("No array keys found")
@@ -210,7 +446,7 @@ class VmaxCapacityCollector:
             # Note: Check your environment's units - may be GB or TB
             system_capacity = SystemCapacity(
                 array_id=array_id,
-                timestamp=datetime.now().isoformat(),
+                timestamp=timestamp,
                 effective_used_capacity_gb=float(result.get('EffectiveUsedCapacity', 0)),
                 max_effective_capacity_gb=float(result.get('MaxEffectiveCapacity', 0)),
                 subscribed_capacity_gb=float(result.get('SubscribedCapacity', 0)),
@@ -240,7 +476,11 @@ class VmaxCapacityCollector:
                 f"System summary collection failed: {e}"
             ) from e
     
-    def get_srp_capacity(self, array_id: str) -> List[SrpCapacity]:
+    def get_srp_capacity(
+        self,
+        array_id: str,
+        timestamp: Optional[str] = None
+    ) -> List[SrpCapacity]:
         """
         Get capacity metrics for all Storage Resource Pools (SRPs).
         
@@ -258,6 +498,7 @@ class VmaxCapacityCollector:
         
         Args:
             array_id: The PowerMax/VMAX array serial number
+            timestamp: Timestamp for every returned object (default: now)
             
         Returns:
             List of SrpCapacity objects, one per SRP
@@ -268,13 +509,13 @@ class VmaxCapacityCollector:
         try:
             logger.info(f"Collecting SRP capacity data for array {array_id}")
             
+            timestamp = timestamp or datetime.now().isoformat()
+            
             srp_capacities = []
             
             # Step 1: Get list of all SRP IDs using performance API
             # This returns the identifiers for all SRPs on the array
-            srp_keys = self.conn.performance.get_storage_resource_pool_keys(
-                array_id=array_id
-            )
+            srp_keys = self._cached_srp_keys(array_id)
             
             if not srp_keys or 'storageResourcePoolInfo' not in srp_keys:
                 logger.warning(f"No SRPs found for array {array_id}")
@@ -283,56 +524,21 @@ class VmaxCapacityCollector:
             srp_list = srp_keys['storageResourcePoolInfo']
             logger.info(f"Found {len(srp_list)} SRP(s) to query")
             
-            # Step 2: Loop through each SRP and get detailed metrics
+            # Step 2: Get detailed metrics for each SRP, max_workers at a time
+            srp_ids = []
             for srp_info in srp_list:
                 srp_id = srp_info.get('storageResourcePoolId')
-                
                 if not srp_id:
                     logger.warning("Skipping SRP with missing ID")
                     continue
-                
-                try:
-                    # Option A: Use performance API for time-series metrics
-                    metrics = [
-                        'UsedCapacity',
-                        'SubscribedCapacity',
-                        'TotalManagedSpace'
-                    ]
-                    
-                    stats = self.conn.performance.get_storage_resource_pool_stats(
-                        array_id=array_id,
-                        storage_resource_pool_id=srp_id,
-                        metrics=metrics,
-                        data_format='Average'
-                    )
-                    
-                    result = stats['result'][0] if stats.get('result') else {}
-                    
-                    # Option B: Alternatively, use provisioning API for current state
-                    # srp_details = self.conn.provisioning.get_srp(
-                    #     srp_id=srp_id,
-                    #     array_id=array_id
-                    # )
-                    
-                    srp_capacity = SrpCapacity(
-                        array_id=array_id,
-                        srp_id=srp_id,
-                        timestamp=datetime.now().isoformat(),
-                        used_capacity_gb=float(result.get('UsedCapacity', 0)),
-                        subscribed_capacity_gb=float(result.get('SubscribedCapacity', 0)),
-                        total_managed_space_gb=float(result.get('TotalManagedSpace', 0))
-                    )
-                    
+                srp_ids.append(srp_id)
+            
+            for srp_capacity in self._map_concurrently(
+                lambda srp_id: self._get_srp_details(array_id, srp_id, timestamp),
+                srp_ids
+            ):
+                if srp_capacity is not None:
                     srp_capacities.append(srp_capacity)
-                    logger.info(
-                        f"SRP '{srp_id}': "
-                        f"{srp_capacity.utilization_percent:.2f}% utilized"
-                    )
-                    
-                except Exception as e:
-                    logger.error(f"Error collecting data for SRP '{srp_id}': {e}")
-                    # Continue with other SRPs rather than failing completely
-                    continue
             
             logger.info(f"Successfully collected capacity for {len(srp_capacities)} SRP(s)")
             return srp_capacities
@@ -348,7 +554,92 @@ class VmaxCapacityCollector:
                 f"SRP capacity collection failed: {e}"
             ) from e
     
-    def get_all_storage_groups(self, array_id: str) -> List[StorageGroupCapacity]:
+    def _map_concurrently(self, func: Callable, items: Iterable) -> Iterator:
+        """
+        Apply func to each item with up to max_workers concurrent calls.
+        
+        The REST calls are I/O bound, so threads overlap their round trips.
+        Results are yielded in input order.
+        
+        Args:
+            func: Callable taking one item
+            items: Items to process
+            
+        Returns:
+            Iterator over func(item) results
+        """
+        with ThreadPoolExecutor(max_workers=self.max_workers) as executor:
+            yield from executor.map(func, items)
+    
+    def _get_srp_details(
+        self,
+        array_id: str,
+        srp_id: str,
+        timestamp: str
+    ) -> Optional[SrpCapacity]:
+        """
+        Get capacity metrics for a single SRP.
+        
+        Safe to call from worker threads.
+        
+        Args:
+            array_id: The PowerMax/VMAX array serial number
+            srp_id: Storage Resource Pool ID
+            timestamp: Snapshot timestamp for the returned object
+            
+        Returns:
+            SrpCapacity object, or None if the SRP could not be read
+        """
+        try:
+            # Option A: Use performance API for time-series metrics
+            metrics = [
+                'UsedCapacity',
+                'SubscribedCapacity',
+                'TotalManagedSpace'
+            ]
+            
+            # The metrics endpoint takes a single SRP ID, so there is no
+            # multi-SRP call; get_srp_capacity() runs these concurrently
+            stats = self.conn.performance.get_storage_resource_pool_stats(
+                array_id=array_id,
+                srp_id=srp_id,
+                metrics=metrics,
+                data_format='Average'
+            )
+            
+            result = stats['result'][0] if stats.get('result') else {}
+            
+            # Option B: Alternatively, use provisioning API for current state
+            # srp_details = self.conn.provisioning.get_srp(
+            #     srp_id=srp_id,
+            #     array_id=array_id
+            # )
+            
+            srp_capacity = SrpCapacity(
+                array_id=array_id,
+                srp_id=srp_id,
+                timestamp=timestamp,
+                used_capacity_gb=float(result.get('UsedCapacity', 0)),
+                subscribed_capacity_gb=float(result.get('SubscribedCapacity', 0)),
+                total_managed_space_gb=float(result.get('TotalManagedSpace', 0))
+            )
+            
+            logger.info(
+                f"SRP '{srp_id}': "
+                f"{srp_capacity.utilization_percent:.2f}% utilized"
+            )
+            return srp_capacity
+            
+        except Exception as e:
+            logger.error(f"Error collecting data for SRP '{srp_id}': {e}")
+            # Continue with other SRPs rather than failing completely
+            return None
+    
+    def get_all_storage_groups(
+        self,
+        array_id: str,
+        timestamp: Optional[str] = None
+    ) -> List[StorageGroupCapacity]:
         """
         Get capacity metrics for all Storage Groups.
         
@@ -356,10 +647,12 @@ class VmaxCapacityCollector:
         A single API call returns data for ALL storage groups, eliminating
         the need for per-object iteration.
         
-        API Path: /univmax/rest/v1/sloprovisioning/symmetrix/{array_id}/storagegroup
-        PyU4V Module: conn.provisioning.get_storage_group_list() then individual calls
+        API Path: /univmax/rest/v1/systems/{array_id}/storage-groups (bulk, preferred)
+        PyU4V Module: conn.storage_groups.get_storage_groups_details()
         
-        Alternative bulk approach: Use the Enhanced API directly for all SGs at once
+        Fallback: if the bulk query fails (or use_bulk is False), groups are
+        listed with conn.provisioning.get_storage_group_list() and fetched
+        one by one.
         
         Key metrics per Storage Group:
         - storageGroupId: Unique identifier
@@ -370,6 +663,7 @@ class VmaxCapacityCollector:
         
         Args:
             array_id: The PowerMax/VMAX array serial number
+            timestamp: Timestamp for every returned object (default: now)
             
         Returns:
             List of StorageGroupCapacity objects
@@ -380,14 +674,27 @@ class VmaxCapacityCollector:
         try:
             logger.info(f"Collecting Storage Group data for array {array_id}")
             
+            timestamp = timestamp or datetime.now().isoformat()
+            
+            # Preferred path: one Enhanced API query for all storage groups
+            if self.use_bulk:
+                try:
+                    storage_group_capacities = self._get_storage_groups_bulk(array_id, timestamp)
+                    logger.info(
+                        f"Successfully collected capacity for "
+                        f"{len(storage_group_capacities)} storage group(s) via Enhanced API"
+                    )
+                    return storage_group_capacities
+                except Exception as e:
+                    logger.warning(
+                        f"Enhanced API bulk storage group query failed ({e}), "
+                        f"falling back to per-group collection"
+                    )
+            
             storage_group_capacities = []
             
             # Step 1: Get list of all storage group IDs
-            # Note: For true bulk efficiency, consider using Enhanced API
-            # directly via REST calls to get all data in one response
-            sg_list = self.conn.provisioning.get_storage_group_list(
-                array_id=array_id
-            )
+            sg_list = self._provisioning(array_id).get_storage_group_list()
             
             if not sg_list:
                 logger.warning(f"No storage groups found for array {array_id}")
@@ -395,42 +702,14 @@ class VmaxCapacityCollector:
             
             logger.info(f"Found {len(sg_list)} storage group(s)")
             
-            # Step 2: For each storage group, get detailed information
-            # NOTE: This is a loop, but PyU4V may batch these internally
-            # For maximum efficiency in production, consider implementing
-            # direct Enhanced API calls to /univmax/rest/v1/.../storagegroup
-            # with proper filtering to get all data in one request
-            
-            for sg_id in sg_list:
-                try:
-                    # Get detailed info for this storage group
-                    sg_details = self.conn.provisioning.get_storage_group(
-                        storage_group_id=sg_id,
-                        array_id=array_id
-                    )
-                    
-                    if not sg_details:
-                        logger.warning(f"No details returned for SG '{sg_id}'")
-                        continue
-                    
-                    # Extract capacity and metadata
-                    storage_group_capacity = StorageGroupCapacity(
-                        array_id=array_id,
-                        storage_group_id=sg_id,
-                        timestamp=datetime.now().isoformat(),
-                        capacity_gb=float(sg_details.get('cap_gb', 0)),
-                        num_volumes=int(sg_details.get('num_of_vols', 0)),
-                        service_level=sg_details.get('slo'),
-                        srp_name=sg_details.get('srp'),
-                        compression_enabled=sg_details.get('compression', False)
-                    )
-                    
+            # Step 2: For each storage group, get detailed information,
+            # max_workers requests at a time
+            for storage_group_capacity in self._map_concurrently(
+                lambda sg_id: self._get_storage_group_details(array_id, sg_id, timestamp),
+                sg_list
+            ):
+                if storage_group_capacity is not None:
                     storage_group_capacities.append(storage_group_capacity)
-                    
-                except Exception as e:
-                    logger.error(f"Error collecting data for SG '{sg_id}': {e}")
-                    # Continue with other storage groups
-                    continue
             
             logger.info(
                 f"Successfully collected capacity for "
@@ -450,18 +729,76 @@ class VmaxCapacityCollector:
                 f"Storage group collection failed: {e}"
             ) from e
     
-    def get_all_volumes(self, array_id: str) -> List[VolumeCapacity]:
+    def _get_storage_group_details(
+        self,
+        array_id: str,
+        sg_id: str,
+        timestamp: str
+    ) -> Optional[StorageGroupCapacity]:
+        """
+        Get capacity metrics for a single Storage Group.
+        
+        Safe to call from worker threads.
+        
+        Args:
+            array_id: The PowerMax/VMAX array serial number
+            sg_id: Storage Group ID
+            timestamp: Snapshot timestamp for the returned object
+            
+        Returns:
+            StorageGroupCapacity object, or None if the group could not be read
+        """
+        try:
+            # Get detailed info for this storage group
+            sg_details = self._provisioning(array_id).get_storage_group(
+                storage_group_name=sg_id
+            )
+            
+            if not sg_details:
+                logger.warning(f"No details returned for SG '{sg_id}'")
+                return None
+            
+            # Extract capacity and metadata
+            # Intern names shared with volumes and other SGs so
+            # each distinct string is held once per snapshot
+            service_level = sg_details.get('slo')
+            srp_name = sg_details.get('srp')
+            return StorageGroupCapacity(
+                array_id=array_id,
+                storage_group_id=sys.intern(sg_id),
+                timestamp=timestamp,
+                capacity_gb=float(sg_details.get('cap_gb', 0)),
+                num_volumes=int(sg_details.get('num_of_vols', 0)),
+                service_level=sys.intern(service_level) if service_level else service_level,
+                srp_name=sys.intern(srp_name) if srp_name else srp_name,
+                compression_enabled=sg_details.get('compression', False)
+            )
+            
+        except Exception as e:
+            logger.error(f"Error collecting data for SG '{sg_id}': {e}")
+            # Continue with other storage groups
+            return None
+    
+    def get_all_volumes(
+        self,
+        array_id: str,
+        timestamp: Optional[str] = None,
+        min_cap_gb: Optional[float] = None,
+        storage_group_filter: Optional[str] = None,
+        emulation: Optional[str] = None
+    ) -> List[VolumeCapacity]:
         """
         Get capacity metrics for all Volumes.
         
         This method uses the ENHANCED REST API for efficient bulk retrieval.
         Like storage groups, a single API call can return data for ALL volumes.
         
-        API Path: /univmax/rest/v1/sloprovisioning/symmetrix/{array_id}/volume
-        PyU4V Module: conn.provisioning.get_volume_list() then individual calls
+        API Path: /univmax/rest/v1/systems/{array_id}/volumes (bulk, preferred)
+        PyU4V Module: conn.volumes.get_volumes_details()
         
-        Alternative bulk approach: Enhanced API direct call returns all volume
-        data at once, which is critical for arrays with thousands of volumes.
+        Fallback: if the bulk query fails (or use_bulk is False), volumes
+        are listed with conn.provisioning.get_volume_list() and fetched one
+        by one, which is slow for arrays with thousands of volumes.
         
         Key metrics per Volume:
         - volume_identifier: Human-readable name
@@ -471,8 +808,15 @@ class VmaxCapacityCollector:
         - storageGroupId: Associated storage group(s)
         - wwn: World Wide Name identifier
         
+        The optional filters are applied by Unisphere, so volumes that do
+        not match are never transferred or fetched.
+        
         Args:
             array_id: The PowerMax/VMAX array serial number
+            timestamp: Timestamp for every returned object (default: now)
+            min_cap_gb: Only volumes larger than this capacity in GB
+            storage_group_filter: Only volumes in this storage group
+            emulation: Only volumes with this emulation (e.g. 'FBA')
             
         Returns:
             List of VolumeCapacity objects
@@ -483,69 +827,61 @@ class VmaxCapacityCollector:
         try:
             logger.info(f"Collecting Volume data for array {array_id}")
             
+            timestamp = timestamp or datetime.now().isoformat()
+            
+            # Same filters in Enhanced API and legacy query syntax
+            bulk_filters = []
+            list_params = {}
+            if min_cap_gb is not None:
+                bulk_filters.append(f"cap_gb gt {min_cap_gb}")
+                list_params['cap_gb'] = f">{min_cap_gb}"
+            if storage_group_filter:
+                bulk_filters.append(f"storage_groups.id eq {storage_group_filter}")
+                list_params['storageGroupId'] = storage_group_filter
+            if emulation:
+                bulk_filters.append(f"emulation eq {emulation}")
+                list_params['emulation'] = emulation
+            
+            # Preferred path: one paged Enhanced API query for all volumes
+            if self.use_bulk:
+                try:
+                    volume_capacities = self._get_volumes_bulk(
+                        array_id, timestamp, bulk_filters
+                    )
+                    logger.info(
+                        f"Successfully collected capacity for "
+                        f"{len(volume_capacities)} volume(s) via Enhanced API"
+                    )
+                    return volume_capacities
+                except Exception as e:
+                    logger.warning(
+                        f"Enhanced API bulk volume query failed ({e}), "
+                        f"falling back to per-volume collection"
+                    )
+            
             volume_capacities = []
             
             # Step 1: Get list of all volume IDs
             # For large arrays, this can return thousands of volumes
-            volume_list = self.conn.provisioning.get_volume_list(
-                array_id=array_id,
-                params=None  # Can filter by SG, SRP, etc. if needed
+            volume_list = self._provisioning(array_id).get_volume_list(
+                filters=list_params or None
             )
             
             if not volume_list:
                 logger.warning(f"No volumes found for array {array_id}")
                 return volume_capacities
             
-            total_volumes = len(volume_list)
-            logger.info(f"Found {total_volumes} volume(s) - this may take a while...")
+            logger.info(f"Found {len(volume_list)} volume(s) - this may take a while...")
             
-            # Step 2: Get detailed info for each volume
-            # IMPORTANT: For production with many volumes, consider:
-            # 1. Batching requests
-            # 2. Using Enhanced API bulk endpoint directly
-            # 3. Parallel processing with thread pool
-            # 4. Filtering to only volumes of interest
-            
-            batch_size = 100  # Process in batches for progress tracking
-            
-            for idx, volume_id in enumerate(volume_list, 1):
-                try:
-                    # Get detailed volume information
-                    vol_details = self.conn.provisioning.get_volume(
-                        device_id=volume_id,
-                        array_id=array_id
-                    )
-                    
-                    if not vol_details:
-                        logger.warning(f"No details returned for volume '{volume_id}'")
-                        continue
-                    
-                    # Extract capacity and metadata
-                    volume_capacity = VolumeCapacity(
-                        array_id=array_id,
-                        volume_id=volume_id,
-                        volume_identifier=vol_details.get('volume_identifier', ''),
-                        timestamp=datetime.now().isoformat(),
-                        capacity_gb=float(vol_details.get('cap_gb', 0)),
-                        allocated_percent=float(vol_details.get('allocated_percent', 0)),
-                        storage_groups=vol_details.get('storageGroupId', []),
-                        wwn=vol_details.get('wwn'),
-                        emulation_type=vol_details.get('type')
-                    )
-                    
+            # Step 2: Get detailed info for each volume, max_workers at a
+            # time; results come back in volume_list order. Only the start
+            # and end counts are logged, not per-batch progress.
+            for volume_capacity in self._map_concurrently(
+                lambda volume_id: self._get_volume_details(array_id, volume_id, timestamp),
+                volume_list
+            ):
+                if volume_capacity is not None:
                     volume_capacities.append(volume_capacity)
-                    
-                    # Log progress for large collections
-                    if idx % batch_size == 0:
-                        logger.info(
-                            f"Progress: {idx}/{total_volumes} volumes processed "
-                            f"({(idx/total_volumes)*100:.1f}%)"
-                        )
-                    
-                except Exception as e:
-                    logger.error(f"Error collecting data for volume '{volume_id}': {e}")
-                    # Continue with other volumes
-                    continue
             
             logger.info(
                 f"Successfully collected capacity for "
@@ -565,21 +901,348 @@ class VmaxCapacityCollector:
                 f"Volume collection failed: {e}"
             ) from e
     
-    def get_all_capacity_data(self, array_id: str) -> CapacitySnapshot:
+    def _get_volume_details(
+        self,
+        array_id: str,
+        volume_id: str,
+        timestamp: str
+    ) -> Optional[VolumeCapacity]:
+        """
+        Get capacity metrics for a single Volume.
+        
+        Used by the per-volume fallback path; safe to call from worker threads.
+        
+        Args:
+            array_id: The PowerMax/VMAX array serial number
+            volume_id: Device ID of the volume
+            timestamp: Snapshot timestamp for the returned object
+            
+        Returns:
+            VolumeCapacity object, or None if the volume could not be read
+        """
+        try:
+            # Get detailed volume information
+            vol_details = self._provisioning(array_id).get_volume(
+                device_id=volume_id
+            )
+            
+            if not vol_details:
+                logger.warning(f"No details returned for volume '{volume_id}'")
+                return None
+            
+            # Extract capacity and metadata
+            return VolumeCapacity(
+                array_id=array_id,
+                volume_id=volume_id,
+                volume_identifier=vol_details.get('volume_identifier', ''),
+                timestamp=timestamp,
+                capacity_gb=float(vol_details.get('cap_gb', 0)),
+                allocated_percent=float(vol_details.get('allocated_percent', 0)),
+                # Interned: thousands of volumes share a few SG names
+                storage_groups=[
+                    sys.intern(name)
+                    for name in vol_details.get('storageGroupId', [])
+                ],
+                wwn=vol_details.get('wwn'),
+                emulation_type=vol_details.get('type')
+            )
+            
+        except Exception as e:
+            logger.error(f"Error collecting data for volume '{volume_id}': {e}")
+            return None
+    
+    def _get_iterator_results(self, response: Dict) -> List[Dict]:
+        """
+        Get all results from a paged REST iterator response.
+        
+        Same as conn.common.get_iterator_results(), but the pages after the
+        first are fetched concurrently (max_workers at a time).
+        
+        Args:
+            response: First-page response with count, maxPageSize, id and resultList
+            
+        Returns:
+            All result rows, in page order
+        """
+        results = list(response['resultList']['result'])
+        results.extend(self._iter_remaining_pages(
+            response.get('id'),
+            int(response.get('count') or 0),
+            int(response.get('maxPageSize') or 0)
+        ))
+        return results
+    
+    def _iter_remaining_pages(
+        self,
+        iterator_id: Optional[str],
+        count: int,
+        max_page_size: int
+    ) -> Iterator[Dict]:
+        """
+        Yield the rows of every iterator page after the first.
+        
+        Pages are fetched concurrently (max_workers at a time) and yielded
+        in page order.
+        
+        Args:
+            iterator_id: Server-side iterator ID from the first response
+            count: Total number of rows
+            max_page_size: Rows per page
+            
+        Returns:
+            Iterator over result rows
+        """
+        if not max_page_size or count <= max_page_size:
+            return
+        
+        pages = [
+            (page * max_page_size + 1, min((page + 1) * max_page_size, count))
+            for page in range(1, math.ceil(count / max_page_size))
+        ]
+        
+        for page_rows in self._map_concurrently(
+            lambda page: self.conn.common.get_iterator_page_list(iterator_id, *page),
+            pages
+        ):
+            yield from page_rows
+    
+    def _get_bulk_rows(self, response) -> List[Dict]:
+        """
+        Return every row of an Enhanced API bulk response.
+        
+        Remaining pages are fetched from the iterator when count > maxPageSize.
+        
+        Args:
+            response: Bulk response (paged iterator dict, or a plain list)
+            
+        Returns:
+            List of result rows
+        """
+        if isinstance(response, dict) and 'resultList' in response:
+            return self._get_iterator_results(response)
+        return response or []
+    
+    def _get_storage_groups_bulk(
+        self,
+        array_id: str,
+        timestamp: str
+    ) -> List[StorageGroupCapacity]:
+        """
+        Get capacity metrics for all Storage Groups with a single Enhanced API query.
+        
+        Replaces the list call plus one get_storage_group() call per group.
+        Rows are converted with StorageGroupCapacity.from_row().
+        
+        API Path: /univmax/rest/v1/systems/{array_id}/storage-groups?select=...
+        PyU4V Module: conn.storage_groups.get_storage_groups_details()
+        
+        Args:
+            array_id: The PowerMax/VMAX array serial number
+            timestamp: Snapshot timestamp shared by every returned object
+            
+        Returns:
+            List of StorageGroupCapacity objects
+            
+        Raises:
+            Exception: Any API error, so the caller can fall back to the
+                per-group path (e.g. Unisphere without the Enhanced API)
+        """
+        response = self.conn.storage_groups.get_storage_groups_details(
+            array_id=array_id,
+            select=STORAGE_GROUP_BULK_ATTRIBUTES
+        )
+        sg_rows = self._get_bulk_rows(response)
+        
+        logger.info(f"Enhanced API returned {len(sg_rows)} storage group(s)")
+        
+        # from_row coerces bad numbers; rows without an id are skipped
+        return [
+            StorageGroupCapacity.from_row(row, array_id, timestamp)
+            for row in _rows_with_id(sg_rows, 'storage group')
+        ]
+    
+    def _iter_volume_rows_stream(
+        self,
+        array_id: str,
+        filters: Optional[List[str]] = None
+    ) -> Iterator[Dict]:
+        """
+        Stream-parse the Enhanced API bulk volume response with ijson.
+        
+        Sends the same request as conn.volumes.get_volumes_details() on
+        PyU4V's Enhanced API session, but reads the body incrementally and
+        yields each row of resultList.result as soon as it is parsed.
+        Rows from later iterator pages follow.
+        
+        Args:
+            array_id: The PowerMax/VMAX array serial number
+            filters: Enhanced API filter expressions, e.g. 'cap_gb gt 10'
+            
+        Returns:
+            Iterator over volume rows
+            
+        Raises:
+            requests.exceptions.HTTPError: If Unisphere returns an error status
+        """
+        rest_client = self.conn.enhanced_rest_client
+        url = (
+            f"{rest_client.base_url}/{self.conn.volumes.enhanced_api_version}"
+            f"/systems/{array_id}/volumes?select={','.join(VOLUME_BULK_ATTRIBUTES)}"
+        )
+        if filters:
+            url += f"&filter={','.join(filters)}"
+        
+        # Iterator metadata may come before or after the rows
+        page_info = {}
+        with rest_client.session.get(url, stream=True, timeout=rest_client.timeout) as response:
+            response.raise_for_status()
+            response.raw.decode_content = True
+            
+            builder = None
+            for prefix, event, value in ijson.parse(response.raw, use_float=True):
+                if builder is not None:
+                    builder.event(event, value)
+                    if prefix == 'resultList.result.item' and event == 'end_map':
+                        yield builder.value
+                        builder = None
+                elif prefix == 'resultList.result.item' and event == 'start_map':
+                    builder = ijson.ObjectBuilder()
+                    builder.event(event, value)
+                elif prefix in ('id', 'count', 'maxPageSize'):
+                    page_info[prefix] = value
+        
+        yield from self._iter_remaining_pages(
+            page_info.get('id'),
+            int(page_info.get('count') or 0),
+            int(page_info.get('maxPageSize') or 0)
+        )
+    
+    def _get_volumes_bulk(
+        self,
+        array_id: str,
+        timestamp: str,
+        filters: Optional[List[str]] = None
+    ) -> List[VolumeCapacity]:
+        """
+        Get capacity metrics for all Volumes with a single Enhanced API query.
+        
+        Instead of one GET per volume, the Enhanced API returns the selected
+        attributes for every volume in one response, paged through a
+        server-side iterator (maxPageSize rows per page). Pages after the
+        first are fetched concurrently.
+        
+        When ijson is installed, the first response is stream-parsed and
+        each volume is built as soon as it arrives, instead of buffering
+        and parsing the whole multi-MB body at once.
+        
+        API Path: /univmax/rest/v1/systems/{array_id}/volumes?select=...
+        PyU4V Module: conn.volumes.get_volumes_details() (without ijson)
+        
+        Rows are converted with VolumeCapacity.from_row().
+        
+        Args:
+            array_id: The PowerMax/VMAX array serial number
+            timestamp: Snapshot timestamp shared by every returned object
+            filters: Enhanced API filter expressions, e.g. 'cap_gb gt 10'
+            
+        Returns:
+            List of VolumeCapacity objects
+            
+        Raises:
+            Exception: Any API error, so the caller can fall back to the
+                per-volume path (e.g. Unisphere without the Enhanced API)
+        """
+        if ijson is not None:
+            volume_rows = self._iter_volume_rows_stream(array_id, filters)
+        else:
+            response = self.conn.volumes.get_volumes_details(
+                array_id=array_id,
+                filters=filters or None,
+                select=VOLUME_BULK_ATTRIBUTES
+            )
+            volume_rows = self._get_bulk_rows(response)
+        
+        # from_row coerces bad numbers; rows without an id are skipped
+        return [
+            VolumeCapacity.from_row(row, array_id, timestamp)
+            for row in _rows_with_id(volume_rows, 'volume')
+        ]
+    
+    def get_all_capacity_data(
+        self,
+        array_id: str,
+        include_volumes: bool = True,
+        force_refresh: bool = False
+    ) -> CapacitySnapshot:
+        """
+        Get a complete capacity snapshot, reusing one collected recently.
+        
+        Snapshots are cached for snapshot_ttl seconds per Unisphere host,
+        array and include_volumes. If a collection fails and an expired
+        snapshot is cached, that snapshot is returned with a warning.
+        
+        Args:
+            array_id: The PowerMax/VMAX array serial number
+            include_volumes: Collect volume-level data (default: True)
+            force_refresh: Skip the cache and always collect
+            
+        Returns:
+            CapacitySnapshot with complete capacity data hierarchy
+            
+        Raises:
+            DataCollectionError: If collection fails and nothing is cached
+        """
+        cache_key = (self._cache_scope, array_id, include_volumes)
+        with _snapshot_cache_lock:
+            cached = _snapshot_cache.get(cache_key)
+        
+        if cached and not force_refresh and cached[0] > time.monotonic():
+            logger.info(f"Using cached capacity snapshot for array {array_id}")
+            return cached[1]
+        
+        try:
+            snapshot = self._collect_snapshot(array_id, include_volumes)
+        except DataCollectionError as e:
+            if not cached:
+                raise
+            logger.warning(
+                f"Collection failed ({e}); returning stale snapshot "
+                f"from {cached[1].collection_timestamp}"
+            )
+            return cached[1]
+        
+        with _snapshot_cache_lock:
+            _snapshot_cache[cache_key] = (time.monotonic() + self.snapshot_ttl, snapshot)
+            if len(_snapshot_cache) > MAX_CACHED_SNAPSHOTS:
+                # Evict the entry closest to (or furthest past) expiry
+                oldest = min(_snapshot_cache, key=lambda k: _snapshot_cache[k][0])
+                del _snapshot_cache[oldest]
+        
+        return snapshot
+    
+    def _collect_snapshot(
+        self,
+        array_id: str,
+        include_volumes: bool = True
+    ) -> CapacitySnapshot:
         """
         Collect complete capacity data across all four levels.
         
-        This is the primary entry point that orchestrates collection from:
+        Called by get_all_capacity_data() on a cache miss; orchestrates
+        collection from:
         1. System level (array-wide summary)
         2. Storage Resource Pools (SRPs)
         3. Storage Groups
         4. Volumes
         
-        The method calls each individual collector and aggregates results
-        into a single CapacitySnapshot object.
+        The method runs the four level collectors concurrently in threads
+        and aggregates results into a single CapacitySnapshot object.
         
         Args:
             array_id: The PowerMax/VMAX array serial number
+            include_volumes: Collect volume-level data (default: True). Volume
+                collection dominates runtime; when False the snapshot has
+                an empty volume list.
             
         Returns:
             CapacitySnapshot with complete capacity data hierarchy
@@ -589,30 +1252,43 @@ class VmaxCapacityCollector:
         """
         try:
             collection_start = datetime.now()
+            # One timestamp for the whole snapshot, shared by every level
+            # and every object in it
+            timestamp = collection_start.isoformat()
             logger.info(
                 f"Starting complete capacity collection for array {array_id}"
             )
             
-            # Collect system-level data
-            logger.info("Step 1/4: Collecting system capacity...")
-            system_capacity = self.get_system_summary(array_id)
-            
-            # Collect SRP data
-            logger.info("Step 2/4: Collecting SRP capacities...")
-            srp_capacities = self.get_srp_capacity(array_id)
-            
-            # Collect Storage Group data
-            logger.info("Step 3/4: Collecting Storage Group capacities...")
-            storage_group_capacities = self.get_all_storage_groups(array_id)
-            
-            # Collect Volume data
-            logger.info("Step 4/4: Collecting Volume capacities...")
-            volume_capacities = self.get_all_volumes(array_id)
+            # The four levels hit disjoint endpoints and do not depend on
+            # each other, so collect them concurrently: wall time is the
+            # slowest level instead of the sum
+            with ThreadPoolExecutor(max_workers=4) as executor:
+                logger.info("Step 1/4: Collecting system capacity...")
+                f_system = executor.submit(self.get_system_summary, array_id, timestamp)
+                
+                logger.info("Step 2/4: Collecting SRP capacities...")
+                f_srps = executor.submit(self.get_srp_capacity, array_id, timestamp)
+                
+                logger.info("Step 3/4: Collecting Storage Group capacities...")
+                f_sgs = executor.submit(self.get_all_storage_groups, array_id, timestamp)
+                
+                if include_volumes:
+                    logger.info("Step 4/4: Collecting Volume capacities...")
+                    f_volumes = executor.submit(self.get_all_volumes, array_id, timestamp)
+                else:
+                    logger.info("Step 4/4: Skipping Volume capacities")
+                    f_volumes = None
+                
+                # result() re-raises the first failing level's error
+                system_capacity = f_system.result()
+                srp_capacities = f_srps.result()
+                storage_group_capacities = f_sgs.result()
+                volume_capacities = f_volumes.result() if f_volumes else []
             
             # Create aggregated snapshot
             snapshot = CapacitySnapshot(
                 array_id=array_id,
-                collection_timestamp=collection_start.isoformat(),
+                collection_timestamp=timestamp,
                 system_capacity=system_capacity,
                 srp_capacities=srp_capacities,
                 storage_group_capacities=storage_group_capacities,
@@ -643,12 +1319,17 @@ class VmaxCapacityCollector:
         """
         Close the connection to Unisphere.
         
-        Clean up the PyU4V connection and release resources.
+        Clean up the PyU4V connection and release resources. Safe to call
+        more than once.
         """
+        if self.conn is None:
+            return
+        
+        # Cleared first so a failing close_session() is not retried
+        conn, self.conn = self.conn, None
         try:
-            if hasattr(self, 'conn') and self.conn:
-                self.conn.close_session()
-                logger.info("Connection closed successfully")
+            conn.close_session()
+            logger.info("Connection closed successfully")
         except Exception as e:
             logger.warning(f"Error closing connection: {e}")
     